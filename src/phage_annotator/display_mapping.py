@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, Iterable, Optional
 
 import numpy as np
@@ -69,8 +70,11 @@ class DisplayMapping:
         """Reset window using percentile bounds."""
         if data.size == 0:
             return
-        self.min_val = float(np.percentile(data, low))
-        self.max_val = float(np.percentile(data, high))
+        # One fused percentile call; computing low/high separately sorts the
+        # data twice.
+        lo, hi = np.percentile(data, (low, high))
+        self.min_val = float(lo)
+        self.max_val = float(hi)
         if self.min_val > self.max_val:
             self.min_val, self.max_val = self.max_val, self.min_val
         self.gamma = 1.0
@@ -143,3 +147,15 @@ def build_norm(mapping: DisplayMapping) -> mcolors.Normalize:
     if mapping.gamma != 1.0:
         return mcolors.PowerNorm(gamma=mapping.gamma, vmin=vmin, vmax=vmax)
     return mcolors.Normalize(vmin=vmin, vmax=vmax)
+
+
+@lru_cache(maxsize=64)
+def build_norm_cached(
+    mode: str, vmin: float, vmax: float, gamma: float
+) -> mcolors.Normalize:
+    """Memoized :func:`build_norm` keyed on the fields that determine it.
+
+    Refreshes where the user did not touch the display sliders reuse the
+    same Normalize instance instead of constructing five new ones.
+    """
+    return build_norm(DisplayMapping(vmin, vmax, gamma, mode))
@@ -0,0 +1,71 @@
+"""Fused frame-normalization kernels for the playback hot path.
+
+A separable ``(frame - vmin) * scale`` through NumPy allocates two
+full-frame temporaries per call — pure memory-bandwidth waste at playback
+rates. When Numba is installed, a ``nogil``/``parallel`` kernel fuses
+subtract, scale, clip, and cast into a single pass that can run inside the
+prefetcher thread concurrently with the GUI. Without Numba, an in-place
+NumPy fallback reuses one scratch buffer instead of allocating per stage.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    @njit(parallel=True, fastmath=True, cache=True, nogil=True)
+    def _to_u8_2d(src, vmin, inv_range, out):  # pragma: no cover - jit-compiled
+        for i in prange(src.shape[0]):
+            for j in range(src.shape[1]):
+                v = (src[i, j] - vmin) * inv_range
+                if v < 0.0:
+                    out[i, j] = 0
+                elif v > 255.0:
+                    out[i, j] = 255
+                else:
+                    out[i, j] = np.uint8(v)
+
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+def normalize_to_u8(
+    src: np.ndarray,
+    vmin: float,
+    inv_range: float,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Return ``clip((src - vmin) * inv_range, 0, 255)`` as uint8.
+
+    Parameters
+    ----------
+    src : numpy.ndarray
+        Source frame (2D) or frame block (3D).
+    vmin : float
+        Display window minimum.
+    inv_range : float
+        Precomputed ``255 / (vmax - vmin)``.
+    out : numpy.ndarray, optional
+        Reusable uint8 output buffer; reallocated when the shape differs.
+    """
+    if out is None or out.shape != src.shape or out.dtype != np.uint8:
+        out = np.empty(src.shape, dtype=np.uint8)
+    if HAVE_NUMBA:
+        if src.ndim == 2:
+            _to_u8_2d(src, vmin, inv_range, out)
+            return out
+        if src.ndim == 3:
+            for t in range(src.shape[0]):
+                _to_u8_2d(src[t], vmin, inv_range, out[t])
+            return out
+    tmp = np.empty(src.shape, dtype=np.float32)
+    np.subtract(src, vmin, out=tmp, casting="unsafe")
+    np.multiply(tmp, inv_range, out=tmp)
+    np.clip(tmp, 0.0, 255.0, out=tmp)
+    out[...] = tmp
+    return out
@@ -0,0 +1,65 @@
+"""Parallel 2D mean-pooling kernel for pyramid level generation.
+
+The pure-NumPy reshape-and-mean pooling walks each frame through a reshape
+view chain and allocates a float temporary per call; with five H×W panels
+pooled per refresh that is a measurable slice of the interactive redraw.
+When Numba is installed, a ``nogil``/``parallel`` kernel writes the pooled
+means straight into a reusable output buffer in one pass over the source.
+Without Numba the caller falls back to the NumPy path.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    @njit(parallel=True, fastmath=True, cache=True, nogil=True)
+    def _mean_pool2d(src, factor, out):  # pragma: no cover - jit-compiled
+        inv = 1.0 / (factor * factor)
+        for i in prange(out.shape[0]):
+            for j in range(out.shape[1]):
+                acc = 0.0
+                for di in range(factor):
+                    for dj in range(factor):
+                        acc += src[i * factor + di, j * factor + dj]
+                out[i, j] = acc * inv
+
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+def mean_pool2d(
+    frame: np.ndarray, factor: int, out: Optional[np.ndarray] = None
+) -> Optional[np.ndarray]:
+    """Mean-pool a 2D frame by ``factor``, preserving integer dtypes.
+
+    Parameters
+    ----------
+    frame : numpy.ndarray
+        2D image array (Y, X).
+    factor : int
+        Integer downsample factor (>= 2).
+    out : numpy.ndarray, optional
+        Reusable output buffer; reallocated when the shape or dtype differs.
+
+    Returns
+    -------
+    numpy.ndarray or None
+        Pooled frame — uint8/uint16 etc. inputs pool to the same dtype so
+        the memory-bound downstream steps move half the bytes — or None
+        when Numba is unavailable and the caller should use its NumPy
+        fallback.
+    """
+    if not HAVE_NUMBA:
+        return None
+    shape = (frame.shape[0] // factor, frame.shape[1] // factor)
+    out_dtype = frame.dtype if frame.dtype.kind in "iu" else np.float32
+    if out is None or out.shape != shape or out.dtype != out_dtype:
+        out = np.empty(shape, dtype=out_dtype)
+    _mean_pool2d(np.ascontiguousarray(frame), factor, out)
+    return out
@@ -0,0 +1,75 @@
+"""Fused norm + LUT application for the playback render path.
+
+For monotone display mappings the matplotlib norm + colormap pipeline
+reduces to a window/level rescale into uint8 followed by a 256-entry RGBA
+table gather. Baking both steps into a cached table and applying it with
+two vectorized passes bypasses the per-frame Python hops matplotlib would
+take for the same result.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import numpy as np
+
+from phage_annotator.display_mapping import DisplayMapping, build_norm
+from phage_annotator.fast_norm import normalize_to_u8
+from phage_annotator.lut_manager import LutSpec, cmap_for
+
+
+@lru_cache(maxsize=32)
+def build_lut_u8(
+    spec: LutSpec, invert: bool, mode: str, vmin_q: int, vmax_q: int, gamma_q: int
+) -> np.ndarray:
+    """Build a (256, 4) uint8 LUT baking norm and colormap into one table.
+
+    Window bounds and gamma arrive quantized to 1e-3 so tiny slider wiggles
+    during a contrast drag land on the same cache entry.
+    """
+    mapping = DisplayMapping(
+        vmin_q / 1000.0, vmax_q / 1000.0, gamma_q / 1000.0, mode
+    )
+    cmap = cmap_for(spec, invert)
+    norm = build_norm(mapping)
+    values = np.linspace(mapping.min_val, mapping.max_val, 256)
+    return (np.asarray(cmap(norm(values))) * 255).astype(np.uint8)
+
+
+def fast_apply_lut(
+    data: np.ndarray,
+    vmin: float,
+    vmax: float,
+    lut: np.ndarray,
+    idx_out: Optional[np.ndarray] = None,
+    out: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Map raw frame data to RGBA uint8 through a prebuilt LUT.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        Raw frame values, any shape.
+    vmin, vmax : float
+        Display window bounds.
+    lut : np.ndarray
+        (256, 4) uint8 table from :func:`build_lut_u8`.
+    idx_out : np.ndarray or None
+        Optional reusable uint8 index buffer matching ``data.shape``.
+    out : np.ndarray or None
+        Optional reusable RGBA output buffer of ``data.shape + (4,)``.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        ``(rgba, idx)`` — the RGBA image and the index buffer, so callers
+        can keep both alive for reuse.
+    """
+    scale = 255.0 / (vmax - vmin) if vmax > vmin else 0.0
+    idx_out = normalize_to_u8(data, vmin, scale, out=idx_out)
+    shape = idx_out.shape + (4,)
+    if out is None or out.shape != shape:
+        out = np.empty(shape, dtype=np.uint8)
+    np.take(lut, idx_out, axis=0, out=out)
+    return out, idx_out
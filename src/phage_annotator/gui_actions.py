@@ -43,16 +43,25 @@ class ActionsMixin:
             files = list(paths)
 
             def _worker(progress, cancel):
+                import os
+                from concurrent.futures import ThreadPoolExecutor
+
                 from phage_annotator.gui_image_io import read_metadata
 
                 metas = []
                 total = len(files)
-                for idx, p in enumerate(files):
-                    if cancel.is_cancelled():
-                        return None
-                    meta = read_metadata(p)
-                    metas.append(meta)
-                    progress(int((idx + 1) / max(1, total) * 100), f"{idx + 1}/{total}")
+                # Header reads are I/O-bound; a small pool hides per-file seek
+                # latency without starving the GUI thread.
+                workers = min(8, os.cpu_count() or 1)
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    for idx, meta in enumerate(
+                        executor.map(read_metadata, files, chunksize=16)
+                    ):
+                        if cancel.is_cancelled():
+                            executor.shutdown(wait=False, cancel_futures=True)
+                            return None
+                        metas.append(meta)
+                        progress(int((idx + 1) / max(1, total) * 100), f"{idx + 1}/{total}")
                 return metas
 
             def _on_result(result):
@@ -609,6 +618,10 @@ class ActionsMixin:
         self.support_image_idx = 0
         self._set_status("Cleared FOV list; kept current image.")
         self.roi_manager.rois_by_image = {0: self.roi_manager.list_rois(keep_idx)}
+        # Wholesale reassignment bypasses the RoiManager mutators; bump the
+        # version by hand so the overlay/stats memos and the refresh-skip
+        # signature see the change.
+        self.roi_manager.bump_version()
         self.roi_manager.set_active(self.roi_manager.active_roi_id)
         self._refresh_roi_manager()
         self._refresh_image()
@@ -677,6 +690,9 @@ class ActionsMixin:
             self.primary_combo.addItem(meta.name)
             self.support_combo.addItem(meta.name)
             self.roi_manager.rois_by_image[meta.id] = []
+        # The clear/repopulate above mutates rois_by_image directly; bump
+        # once so version-keyed memos drop the previous session's overlays.
+        self.roi_manager.bump_version()
         self._refresh_annotation_availability()
         self._refresh_roi_manager()
         self._refresh_metadata_dock(self.primary_image.id)
@@ -25,3 +25,6 @@ class CancelTokenShim:
 
     def is_cancelled(self) -> bool:
         return False
+
+    def wait(self, timeout: float) -> bool:
+        return False
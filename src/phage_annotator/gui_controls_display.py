@@ -329,6 +329,7 @@ class DisplayControlsMixin:
         self.loop_playback = self.loop_chk.isChecked()
 
     def _on_speed_change(self, value: int) -> None:
+        self._playback_fps_cached = int(value)
         if getattr(self, "fps_label", None) is not None:
             self.fps_label.setText(f"FPS: {value}")
 
@@ -536,13 +537,16 @@ class DisplayControlsMixin:
 
     def _on_profile_mode(self) -> None:
         self.profile_enabled = self.profile_mode_chk.isChecked()
+        self._update_diag_live()
 
     def _on_profile_chk_changed(self) -> None:
         self.profile_enabled = self.profile_chk.isChecked()
+        self._update_diag_live()
         self._refresh_image()
 
     def _on_hist_chk_changed(self) -> None:
         self.hist_enabled = self.hist_chk.isChecked()
+        self._update_diag_live()
         self._refresh_image()
 
     def _clear_profile(self) -> None:
@@ -631,7 +635,9 @@ class DisplayControlsMixin:
             return
         low_pct = float(self._settings.value("autoLowPct", 0.35))
         high_pct = float(self._settings.value("autoHighPct", 99.65))
-        use_roi = self.auto_roi_chk.isChecked()
+        # A "none" ROI selects everything; treating it as no-ROI skips a
+        # full-frame boolean copy per sampled frame below.
+        use_roi = self.auto_roi_chk.isChecked() and self.roi_shape != "none"
         scope = self.auto_scope_combo.currentText()
         target = self.auto_target_combo.currentText()
 
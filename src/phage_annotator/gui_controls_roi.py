@@ -98,6 +98,7 @@ class RoiControlsMixin:
             return
         rois = load_rois_json(pathlib.Path(path))
         self.roi_manager.rois_by_image[self.primary_image.id] = rois
+        self.roi_manager.bump_version()
         if rois:
             self.roi_manager.set_active(rois[0].roi_id)
             self._sync_active_roi(rois[0])
@@ -146,8 +147,10 @@ class RoiControlsMixin:
             roi.name = item.text()
         elif item.column() == 2:
             roi.color = item.text()
+            self.roi_manager.bump_version()
         elif item.column() == 3:
             roi.visible = item.checkState() == QtCore.Qt.CheckState.Checked
+            self.roi_manager.bump_version()
             self._refresh_image()
     def _roi_mgr_selected(self) -> Optional[Roi]:
         if self.roi_manager_widget is None:
@@ -16,6 +16,7 @@ class EventsMixin:
         self.canvas.mpl_connect("button_press_event", self._on_mouse_press)
         self.canvas.mpl_connect("button_release_event", self._on_mouse_release)
         self.canvas.mpl_connect("motion_notify_event", self._on_mouse_move)
+        self.canvas.mpl_connect("resize_event", self._on_canvas_resize)
         self._bind_axis_callbacks()
         self.fov_list.currentRowChanged.connect(self._set_fov)
         self.primary_combo.currentIndexChanged.connect(self._set_primary_combo)
@@ -31,6 +32,10 @@ class EventsMixin:
         self.t_slider.valueChanged.connect(self._on_play_tick)
         self.z_slider.valueChanged.connect(self._on_play_tick)
         self.speed_slider.valueChanged.connect(self._on_speed_change)
+        # Mirror slider values into plain attributes for the playback worker.
+        self.z_slider.valueChanged.connect(lambda v: setattr(self, "_playback_z_cached", int(v)))
+        self._playback_fps_cached = int(self.speed_slider.value())
+        self._playback_z_cached = int(self.z_slider.value())
         self.t_slider.sliderPressed.connect(self._on_t_slider_pressed)
         self.t_slider.sliderReleased.connect(self._on_t_slider_released)
         self.z_slider.sliderPressed.connect(self._on_z_slider_pressed)
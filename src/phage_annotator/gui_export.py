@@ -143,6 +143,7 @@ class ExportMixin:
         self.redo_act.setEnabled(self.controller.can_redo())
         if self.controller.rois_by_image:
             self.roi_manager.rois_by_image = self.controller.rois_by_image
+            self.roi_manager.bump_version()
         self._smlm_run_history = list(self.controller.session_state.smlm_runs)
         self._last_smlm_run = self._smlm_run_history[-1] if self._smlm_run_history else None
         self._threshold_settings = dict(self.controller.session_state.threshold_settings)
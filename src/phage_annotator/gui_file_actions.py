@@ -11,6 +11,8 @@ Dependencies:
 
 from __future__ import annotations
 
+import collections
+import itertools
 import pathlib
 from typing import List
 
@@ -81,13 +83,18 @@ class FileActionsMixin:
         path : str
             Path to add.
         """
-        recent = self._load_recent_images()
+        limit = self._recent_limit()
+        # The stored list is most-recent-first, so trim from the head;
+        # deque(iterable, maxlen) alone would keep the tail, i.e. drop the
+        # newest entries instead of the oldest.
+        recent = collections.deque(
+            itertools.islice(self._load_recent_images(), limit), maxlen=limit
+        )
         if path in recent:
             recent.remove(path)
-        recent.insert(0, path)
-        # Trim to limit
-        recent[:] = recent[: self._recent_limit()]
-        self.session_controller.state.recent_images = recent
+        recent.appendleft(path)
+        # State keeps a plain list so JSON persistence stays unchanged.
+        self.session_controller.state.recent_images = list(recent)
         self._update_recent_menu()
 
     def _update_recent_menu(self) -> None:
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import os
+from dataclasses import replace
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -10,13 +13,28 @@ import tifffile as tif
 from phage_annotator.gui_constants import BIG_TIFF_BYTES_THRESHOLD
 from phage_annotator.gui_debug import debug_log
 from phage_annotator.image_models import LazyImage
-from phage_annotator.io import read_metadata_summary, standardize_axes
+from phage_annotator.io import standardize_axes, standardize_axes_fast
+from phage_annotator.metadata_reader import summary_from_tiff
 
 
 def read_metadata(path: Path) -> LazyImage:
-    """Read lightweight metadata for an image without loading full data."""
-    summary = read_metadata_summary(path)
-    with tif.TiffFile(str(path)) as tf:
+    """Read lightweight metadata for an image without loading full data.
+
+    Results are cached by ``(path, mtime, size)`` so repeated navigation over
+    unchanged files does not re-parse the TIFF headers.
+    """
+    st = path.stat()
+    cached = _read_metadata_cached(str(path), st.st_mtime_ns, st.st_size)
+    # Return a shallow copy; callers mutate ``id``/``array`` on the instance.
+    return replace(cached)
+
+
+@lru_cache(maxsize=4096)
+def _read_metadata_cached(path_str: str, mtime_ns: int, size: int) -> LazyImage:
+    del mtime_ns, size  # cache-key components only
+    path = Path(path_str)
+    with tif.TiffFile(path_str) as tf:
+        summary = summary_from_tiff(tf)
         page = tf.series[0]
         shape = page.shape
         dtype = str(page.dtype)
@@ -24,14 +42,14 @@ def read_metadata(path: Path) -> LazyImage:
     interpret = "auto"
     axis_auto_used = False
     axis_auto_mode = None
-    if ome_axes and len(ome_axes) == len(shape):
-        axes = ome_axes.upper()
-        has_time = "T" in axes
-        has_z = "Z" in axes
-        if len(shape) == 3:
-            if "T" in axes and "Z" not in axes:
+    axes_upper = ome_axes.upper() if ome_axes else None
+    if axes_upper is not None:
+        has_time = "T" in axes_upper
+        has_z = "Z" in axes_upper
+        if len(axes_upper) == len(shape) and len(shape) == 3:
+            if has_time and not has_z:
                 interpret = "time"
-            elif "Z" in axes and "T" not in axes:
+            elif has_z and not has_time:
                 interpret = "depth"
     else:
         # Heuristic: only used when no OME metadata is available.
@@ -40,9 +58,6 @@ def read_metadata(path: Path) -> LazyImage:
             axis_auto_mode = "time" if shape[0] <= 5 else "depth"
         has_time = len(shape) == 4 or (len(shape) == 3 and axis_auto_mode == "time")
         has_z = len(shape) == 4 or (len(shape) == 3 and axis_auto_mode == "depth")
-    if ome_axes:
-        has_time = "T" in ome_axes.upper()
-        has_z = "Z" in ome_axes.upper()
     return LazyImage(
         path=path,
         name=path.name,
@@ -59,16 +74,39 @@ def read_metadata(path: Path) -> LazyImage:
 
 
 def load_array(
-    path: Path, interpret_3d_as: str = "auto", ome_axes: Optional[str] = None
+    path: Path,
+    interpret_3d_as: str = "auto",
+    ome_axes: Optional[str] = None,
+    has_time: Optional[bool] = None,
+    has_z: Optional[bool] = None,
 ) -> Tuple[object, bool, bool]:
-    """Load image data and standardize to (T, Z, Y, X)."""
-    with tif.TiffFile(str(path)) as tf:
-        nbytes = tf.asarray().nbytes
-    if nbytes >= BIG_TIFF_BYTES_THRESHOLD:
-        debug_log(f"Using memmap for {path} ({nbytes/1e6:.1f} MB)")
-        arr = tif.memmap(str(path))
+    """Load image data and standardize to (T, Z, Y, X).
+
+    When ``has_time``/``has_z`` were already derived by :func:`read_metadata`
+    (and no OME axes or manual interpretation override applies), axis
+    standardization takes a fast path that skips re-inference.
+    """
+    path_str = os.fspath(path)
+    with tif.TiffFile(path_str) as tfh:
+        # Size from series metadata only; decoding here would double I/O.
+        series = tfh.series[0]
+        nbytes = series.size * series.dtype.itemsize
+        # Reuse the open handle for the read; a second open would re-parse.
+        if nbytes >= BIG_TIFF_BYTES_THRESHOLD:
+            debug_log(f"Using memmap for {path} ({nbytes/1e6:.1f} MB)")
+            arr = tfh.asarray(out="memmap")
+        else:
+            debug_log(f"Loading into memory {path} ({nbytes/1e6:.1f} MB)")
+            arr = tfh.asarray()
+    if (
+        ome_axes is None
+        and interpret_3d_as == "auto"
+        and has_time is not None
+        and has_z is not None
+    ):
+        std, has_time, has_z = standardize_axes_fast(arr, has_time, has_z)
     else:
-        debug_log(f"Loading into memory {path} ({nbytes/1e6:.1f} MB)")
-        arr = tif.imread(str(path))
-    std, has_time, has_z = standardize_axes(arr, interpret_3d_as=interpret_3d_as, ome_axes=ome_axes)
+        std, has_time, has_z = standardize_axes(
+            arr, interpret_3d_as=interpret_3d_as, ome_axes=ome_axes
+        )
     return std, has_time, has_z
@@ -35,41 +35,56 @@ class JobsMixin:
         on_error=None,
         on_progress=None,
     ) -> CancelToken:
-        """Submit an analysis job with optional throttling during playback."""
+        """Submit an analysis job with optional throttling during playback.
+
+        Throttled submissions coalesce through one reusable single-shot timer:
+        the latest pending spec wins and intermediate ones are dropped.
+        """
         token = CancelToken()
         throttle_hz = float(self._settings.value("throttleAnalysisHzDuringPlayback", 2, type=float))
         min_interval = 1.0 / throttle_hz if throttle_hz > 0 else 0.0
 
-        def _do_submit() -> None:
-            self._analysis_submit_pending = False
-            self._analysis_last_submit = time.monotonic()
-            self.jobs.submit(
-                fn,
-                name=name,
-                on_result=on_result,
-                on_error=on_error,
-                on_progress=on_progress,
-                cancel_token=token,
-            )
-
         if self._playback_mode and min_interval > 0:
             now = time.monotonic()
             remaining = min_interval - (now - self._analysis_last_submit)
             if remaining > 0:
-                if not self._analysis_submit_pending:
-                    self._analysis_submit_pending = True
-                    QtCore.QTimer.singleShot(int(remaining * 1000), _do_submit)
+                self._pending_submit = (fn, name, on_result, on_error, on_progress, token)
+                if not self._analysis_throttle_timer.isActive():
+                    self._analysis_throttle_timer.start(int(remaining * 1000))
                 return token
 
-        _do_submit()
+        self._do_submit(fn, name, on_result, on_error, on_progress, token)
         return token
 
+    def _flush_pending_submit(self) -> None:
+        """Run the most recent throttled analysis submission, if any."""
+        pending = self._pending_submit
+        self._pending_submit = None
+        if pending is not None:
+            self._do_submit(*pending)
+
+    def _do_submit(self, fn, name, on_result, on_error, on_progress, token) -> None:
+        self._analysis_last_submit = time.monotonic()
+        self.jobs.submit(
+            fn,
+            name=name,
+            on_result=on_result,
+            on_error=on_error,
+            on_progress=on_progress,
+            cancel_token=token,
+        )
+
     def _bump_job_generation(self) -> None:
         """Invalidate cached job results by bumping a generation counter."""
         self._job_generation += 1
         self._projection_jobs.clear()
+        self._projection_jobs_by_id.clear()
+        self._projection_jobs_by_image.clear()
         self._pyramid_jobs.clear()
-        self.proj_cache.clear()
+        # Stamp entries stale instead of freeing them synchronously; a
+        # deferred GC reclaims the memory off the critical path.
+        self.proj_cache.bump_generation()
+        self._proj_cache_gc_timer.start()
 
     def _cancel_all_jobs(self) -> None:
         """Cancel all known background jobs."""
@@ -111,6 +126,17 @@ class JobsMixin:
         # Store in full logs list for filtering
         if hasattr(self, '_all_logs'):
             self._all_logs.append(text)
+        # Buffer and flush at ~30 Hz; one appendPlainText per burst instead of
+        # one widget relayout per message.
+        self._log_buffer.append(text)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log_buffer(self) -> None:
+        if not self._log_buffer or self.log_view is None:
+            return
+        text = "\n".join(self._log_buffer)
+        self._log_buffer.clear()
         self.log_view.appendPlainText(text)
 
     def _install_exception_hook(self) -> None:
@@ -211,28 +237,48 @@ class JobsMixin:
             return
         self.jobs.cancel(self._active_job_id)
 
+    def _register_projection_job(self, key: tuple, job_id: str) -> None:
+        """Track a projection job in the forward map and both reverse indexes."""
+        self._projection_jobs[key] = job_id
+        self._projection_jobs_by_id.setdefault(job_id, []).append(key)
+        self._projection_jobs_by_image.setdefault((key[0], key[1]), []).append(key)
+
     def _cancel_projection_jobs(self, image_id: int) -> None:
         for kind in ("mean", "std", "composite"):
-            keys = [k for k in self._projection_jobs.keys() if k[0] == image_id and k[1] == kind]
+            keys = self._projection_jobs_by_image.pop((image_id, kind), [])
             for key in keys:
                 job_id = self._projection_jobs.pop(key, None)
                 if job_id:
+                    bucket = self._projection_jobs_by_id.get(job_id)
+                    if bucket is not None:
+                        try:
+                            bucket.remove(key)
+                        except ValueError:
+                            pass
+                        if not bucket:
+                            self._projection_jobs_by_id.pop(job_id, None)
                     self.jobs.cancel(job_id)
 
     def _clear_projection_job_name(self, job_id: str) -> None:
-        for key, name in list(self._projection_jobs.items()):
-            if name == job_id:
-                self._projection_jobs.pop(key, None)
+        for key in self._projection_jobs_by_id.pop(job_id, []):
+            self._projection_jobs.pop(key, None)
+            bucket = self._projection_jobs_by_image.get((key[0], key[1]))
+            if bucket is not None:
+                try:
+                    bucket.remove(key)
+                except ValueError:
+                    pass
+                if not bucket:
+                    self._projection_jobs_by_image.pop((key[0], key[1]), None)
 
     def _run_demo_job(self) -> None:
         def _job(progress, cancel_token):
-            import time
-
             for i in range(101):
-                if cancel_token.is_cancelled():
-                    return None
                 progress(i, f"Step {i}/100")
-                time.sleep(0.02)
+                # Event-based sleep wakes immediately on cancel instead of
+                # finishing the tick first.
+                if cancel_token.wait(0.02):
+                    return None
             return None
 
         self.jobs.submit(_job, name="Demo Job")
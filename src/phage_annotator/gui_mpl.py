@@ -18,23 +18,28 @@ from __future__ import annotations
 
 import pathlib
 import threading
-from collections import deque
-from typing import Deque, Dict, List, Optional, Sequence, Tuple
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 from matplotlib.backends.qt_compat import QtCore, QtWidgets
 
 from phage_annotator.annotations import Keypoint
 from phage_annotator.config import DEFAULT_CONFIG
 from phage_annotator.gui_actions import ActionsMixin
 from phage_annotator.gui_annotations import AnnotationsMixin
-from phage_annotator.gui_constants import INTERACTIVE_DOWNSAMPLE, PLAYBACK_BUFFER_SIZE
+from phage_annotator.gui_constants import (
+    DEFAULT_PLAYBACK_FPS,
+    INTERACTIVE_DOWNSAMPLE,
+    PLAYBACK_BUFFER_SIZE,
+)
 from phage_annotator.gui_controls import ControlsMixin
 from phage_annotator.gui_events import EventsMixin
 from phage_annotator.gui_export import ExportMixin
 from phage_annotator.gui_file_actions import FileActionsMixin
 from phage_annotator.gui_image_io import read_metadata
 from phage_annotator.gui_jobs import JobsMixin
-from phage_annotator.gui_playback import PlaybackMixin
+from phage_annotator.gui_playback import PlaybackMixin, _PlayState
 from phage_annotator.gui_rendering import RenderingMixin
 from phage_annotator.gui_roi_crop import RoiCropMixin
 from phage_annotator.gui_state import StateMixin
@@ -109,16 +114,65 @@ class KeypointAnnotator(
         self._playback_mode = False
         self._playback_ring = FrameRingBuffer(PLAYBACK_BUFFER_SIZE)
         self._playback_stop_event = threading.Event()
-        self._playback_thread: Optional[threading.Thread] = None
+        self._playback_thread: Optional[QtCore.QThread] = None
         self._playback_buffer_size = PLAYBACK_BUFFER_SIZE
         self._playback_direction = 1
+        # Slider values mirrored into plain ints so the playback worker never
+        # touches Qt widgets from its own thread.
+        self._playback_fps_cached = DEFAULT_PLAYBACK_FPS
+        self._playback_z_cached = 0
+        self._playback_t_max: Optional[int] = None
         self._playback_overlay_stride = 3
         self._playback_frame_counter = 0
-        self._fps_times: Deque[float] = deque(maxlen=120)
+        # Preallocated FPS ring with a running sum; O(1) per frame, no
+        # deque/sum() interpreter overhead on the playback hot path.
+        self._fps_buf = np.zeros(120, dtype=np.float64)
+        self._fps_fill = 0
+        self._fps_head = 0
+        self._fps_sum = 0.0
         self._fps_text = None
+        self._fps_last_str = ""
+        # Hot-path playback render state (blit background, animated title,
+        # snapshotted artists) lives in one slotted object.
+        self._p = _PlayState()
+        # Fingerprint of the last full refresh; see _refresh_signature.
+        self._last_refresh_sig: Optional[tuple] = None
+        # Whole-pipeline fingerprint used by _refresh_image to skip no-op
+        # redraws; see _full_refresh_signature.
+        self._last_full_sig: Optional[tuple] = None
+        # (cursor, Z, LUT key) at the last pause; enables warm ring reuse
+        # on a quick resume with unchanged state.
+        self._paused_at: Optional[tuple] = None
+        # Reusable uint8 scratch buffer for fused frame normalization.
+        self._playback_norm_out: Optional[np.ndarray] = None
+        # Rotating RGBA block buffers for copy-free set_data; sized to the
+        # in-flight block count in _apply_playback_lut.
+        self._rgba_buffers: List[Optional[np.ndarray]] = []
+        self._rgba_buf_idx = 0
         self._playback_cursor = 0
-        self._last_frame_time: Optional[float] = None
+        # Latest-frame slot for coalesced delivery from the playback thread:
+        # at most one queued GUI invocation is in flight at a time.
+        self._latest_frame_lock = threading.Lock()
+        self._latest_frame: Optional[Tuple[np.ndarray, int]] = None
+        self._refresh_pending = False
+        # Monotonic nanosecond clock for FPS sampling (QElapsedTimer uses the
+        # platform performance counter; one cheap C++ read per sample).
+        self._elapsed = QtCore.QElapsedTimer()
+        self._elapsed.start()
+        self._last_frame_ns: Optional[int] = None
         self._playback_underruns = 0
+        self._playback_frames_skipped = 0
+        # Status bar refresh during playback is throttled to 5 Hz; per-frame
+        # updates are wasted repaints no one can read.
+        self._playback_status_timer = QtCore.QTimer(self)
+        self._playback_status_timer.setInterval(200)
+        self._playback_status_timer.timeout.connect(self._update_status)
+        # Coalesces buffer-stat label updates during sustained underruns; Qt
+        # merges repeated start() calls on a single-shot timer into one fire.
+        self._buffer_stats_timer = QtCore.QTimer(self)
+        self._buffer_stats_timer.setSingleShot(True)
+        self._buffer_stats_timer.setInterval(250)
+        self._buffer_stats_timer.timeout.connect(self._update_buffer_stats)
         # Panel visibility controls which axes exist; at least one must remain visible.
         self._panel_visibility = {
             "frame": True,
@@ -143,6 +197,12 @@ class KeypointAnnotator(
         self._debounce_timer.setSingleShot(True)
         self._debounce_timer.setInterval(80)
         self._debounce_timer.timeout.connect(self._refresh_image)
+        # Coalesces ROI/crop spin-box bursts (holding an arrow repeat fires
+        # tens of valueChanged signals per second) into one refresh.
+        self._roi_refresh_timer = QtCore.QTimer()
+        self._roi_refresh_timer.setSingleShot(True)
+        self._roi_refresh_timer.setInterval(50)
+        self._roi_refresh_timer.timeout.connect(self._refresh_image)
         self.downsample_factor = int(
             self._settings.value("downsampleFactor", INTERACTIVE_DOWNSAMPLE, type=int)
         )
@@ -153,8 +213,15 @@ class KeypointAnnotator(
         self._projection_jobs: Dict[
             Tuple[int, str, Tuple[float, float, float, float], int, int], str
         ] = {}
+        # Reverse indexes so cancel/clear handlers avoid O(N) scans on the UI thread.
+        self._projection_jobs_by_id: Dict[str, List[tuple]] = {}
+        self._projection_jobs_by_image: Dict[Tuple[int, str], List[tuple]] = {}
         cache_max_mb = self._settings.value("cacheMaxMB", 1024, type=int)
         self.proj_cache = ProjectionCache(max_mb=cache_max_mb)
+        self._proj_cache_gc_timer = QtCore.QTimer(self)
+        self._proj_cache_gc_timer.setSingleShot(True)
+        self._proj_cache_gc_timer.setInterval(1000)
+        self._proj_cache_gc_timer.timeout.connect(self.proj_cache.gc_stale)
         self._diag_hist_source = None
         self.jobs = JobManager(self)
         self._active_job_id: Optional[str] = None
@@ -224,9 +291,16 @@ class KeypointAnnotator(
         self.show_roi_handles = bool(self._settings.value("showRoiHandles", True, type=bool))
         self._density_job_id: Optional[str] = None
         self._density_overlay = None
+        # Summed-area table cached per density overlay for O(1) crop+pool.
+        self._density_sat = None
+        self._density_sat_id = None
         self._density_overlay_extent = None
         self._density_overlay_alpha = 0.6
         self._density_overlay_cmap = "magma"
+        # Resolved Colormap cache; _refresh_image must not hit the
+        # matplotlib registry per frame (see _density_cmap_obj).
+        self._density_cmap_name: Optional[str] = None
+        self._density_cmap = None
         self._density_contours = False
         self._density_last_result = None
         self._density_last_panel = "frame"
@@ -294,13 +368,35 @@ class KeypointAnnotator(
         self._autosave_timer.setInterval(120000)
         self._autosave_timer.timeout.connect(self._autosave_tick)
         self._analysis_last_submit = 0.0
-        self._analysis_submit_pending = False
+        self._pending_submit = None
+        self._analysis_throttle_timer = QtCore.QTimer(self)
+        self._analysis_throttle_timer.setSingleShot(True)
+        self._analysis_throttle_timer.timeout.connect(self._flush_pending_submit)
+        self._log_buffer: List[str] = []
+        self._log_flush_timer = QtCore.QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(33)
+        self._log_flush_timer.timeout.connect(self._flush_log_buffer)
         self._contrast_drag_active = False
         self._auto_job_id: Optional[str] = None
-        self._norm_cache: Dict[Tuple[str, float, float, float, str], object] = {}
         self._hist_job_id: Optional[str] = None
         self._cursor_xy: Optional[Tuple[float, float]] = None
+        # Last orthoview input fingerprint; _refresh_orthoview skips the
+        # slice + repaint when it matches.
+        self._ortho_cache_key: Optional[tuple] = None
         self._smlm_results = []
+        # SoA mirrors of the localization lists (see _smlm_loc_arrays).
+        self._smlm_soa_id: Optional[int] = None
+        self._smlm_xy_px: Optional[np.ndarray] = None
+        self._smlm_photons: Optional[np.ndarray] = None
+        self._smlm_unc: Optional[np.ndarray] = None
+        self._deepstorm_soa_id: Optional[int] = None
+        self._deepstorm_xy_px: Optional[np.ndarray] = None
+        self._deepstorm_score: Optional[np.ndarray] = None
+        # Particle centroid SoA mirror (see _particles_xy); keyed on
+        # (id, len) because detection extends the result list in place.
+        self._particles_xy_key: Optional[Tuple[int, int]] = None
+        self._particles_xy_arr: Optional[np.ndarray] = None
         self._smlm_overlay = None
         self._smlm_overlay_extent = None
         self._smlm_job_id: Optional[str] = None
@@ -336,8 +432,32 @@ class KeypointAnnotator(
         self._hist_cache = None
         self._hist_cache_key = None
         self._hist_last_time = 0.0
+        self._hist_last_sig = None
+        # Preallocated index buffers for the 200-point line-profile gather.
+        self._profile_iy = np.empty(200, dtype=np.intp)
+        self._profile_ix = np.empty(200, dtype=np.intp)
+        # Persistent diagnostic-panel artists, updated in place via
+        # set_data/set_text instead of clear-and-replot per refresh.
+        self._profile_curve = None
+        self._hist_curve = None
+        # Snapshotted enabled+checked+dock-visible state; see _update_diag_live.
+        self._profile_live = False
+        self._hist_live = False
+        self._hist_vmin_line = None
+        self._hist_vmax_line = None
+        self._hist_stats_text = None
         self._hist_scope_mode = "Current slice"
         self.roi_manager = RoiManager()
+        # Memoized _build_roi_overlays output; invalidated via RoiManager.version.
+        self._roi_overlays_cache_key: Optional[tuple] = None
+        self._roi_overlays_cache: Optional[dict] = None
+        # Small LRU of boolean ROI masks keyed by (shape, rect, shape kind);
+        # see RoiCropMixin._roi_mask.
+        self._roi_mask_cache: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+        # Matching LRU of box-local gather indices; see _roi_region_indices.
+        self._roi_idx_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        # One-slot memo of the last resolved crop bounds; see _crop_bounds.
+        self._crop_bounds_memo: Optional[tuple] = None
         self.roi_manager_widget = None
         self.results_widget = None
         self.recorder = ActionRecorder()
@@ -351,7 +471,10 @@ class KeypointAnnotator(
             self._playback_ring,
             block_size=int(self._settings.value("prefetchBlockSizeFrames", 64, type=int)),
             max_inflight_blocks=int(self._settings.value("prefetchMaxInflightBlocks", 2, type=int)),
-            stop_event=self._playback_stop_event,
+            # The prefetcher owns its stop event: it sets it at end-of-data,
+            # which must park the reader without killing the tick loop that
+            # is still draining the buffered tail frames.
+            stop_event=threading.Event(),
         )
 
         self._setup_ui()
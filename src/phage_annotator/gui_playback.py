@@ -2,14 +2,48 @@
 
 from __future__ import annotations
 
-import threading
 import time
 from typing import Optional
 
 import numpy as np
 from matplotlib.backends.qt_compat import QtCore, QtWidgets
 
+from phage_annotator.fast_render import build_lut_u8, fast_apply_lut
 from phage_annotator.gui_constants import DEBUG_FPS, FPS_UPDATE_STRIDE
+from phage_annotator.lut_manager import LUTS
+
+
+class _PlayState:
+    """Slotted bundle of render objects touched on every playback frame.
+
+    A single ``self._p`` lookup plus C-level slot access replaces several
+    dict probes through the mixin MRO per frame.
+    """
+
+    __slots__ = ("im_artist", "ax", "canvas", "fps_text", "title_text", "bg")
+
+    def __init__(self) -> None:
+        self.im_artist = None
+        self.ax = None
+        self.canvas = None
+        self.fps_text = None
+        self.title_text = None
+        self.bg = None
+
+
+class _PlaybackThread(QtCore.QThread):
+    """QThread wrapper for the playback tick loop.
+
+    Running the loop in a QThread lets us pin it at a high scheduler
+    priority, which noticeably reduces frame-time variance at high FPS.
+    """
+
+    def __init__(self, window) -> None:
+        super().__init__(window)
+        self._window = window
+
+    def run(self) -> None:
+        self._window._playback_tick()
 
 
 class PlaybackMixin:
@@ -18,99 +52,405 @@ class PlaybackMixin:
     def start_playback_t(self, fps: Optional[int] = None) -> None:
         """Start high-FPS playback along the time axis with prefetch buffer."""
         self._ensure_loaded(self.current_image_idx)
-        # Heavy refresh once to ensure artists/vmin/vmax exist.
-        if self.im_frame is None or self._axis_scale(self.ax_frame) != 1.0:
+        # Heavy refresh only when the artists are missing or the render
+        # configuration changed since the last one; replaying at unchanged
+        # settings reuses the existing artists.
+        if self.im_frame is None or self._last_refresh_sig != self._refresh_signature():
             self._refresh_image()
+            # Render settings changed; any RGBA frames queued before the
+            # pause were mapped with the old settings.
+            self._paused_at = None
         self._playback_mode = True
         self.play_mode = "t"
         if fps is not None:
             self.speed_slider.setValue(fps)
         self._playback_cursor = self.t_slider.value()
-        self._playback_ring.reset()
-        self._prefetcher.start(self._playback_cursor, self.z_slider.value())
+        # Cache the T bound once; the worker must not walk the LazyImage
+        # attribute chain (and its lazy-load check) every frame.
+        arr = self.primary_image.array
+        self._playback_t_max = int(arr.shape[0]) - 1 if arr is not None else 0
+        if arr is not None:
+            # The ring holds display-ready RGBA uint8 (4 B/px); grant
+            # higher-precision sources proportionally more frames so the
+            # memory budget set for raw frames stays unchanged.
+            scale = max(1, arr.dtype.itemsize // 4)
+            self._playback_ring.set_capacity(self._playback_buffer_size * scale)
+        self._capture_frame_background()
+        warm_key = (
+            self._playback_cursor,
+            int(self.z_slider.value()),
+            self._playback_lut_key(),
+        )
+        if self._paused_at == warm_key and not self._playback_ring.is_empty():
+            # Warm resume: the ring still holds frames queued when playback
+            # was paused at this cursor, at the same Z and with the same
+            # display mapping, so skip the flush and the first block-read
+            # latency. Any mismatch means the queued RGBA frames (and the
+            # prefetcher's preserved Z cursor) are stale; take the cold
+            # path below, which flushes and re-primes with current state.
+            self._prefetcher.resume()
+        else:
+            self._playback_ring.reset()
+            # Read the first block synchronously so frames are already queued
+            # when the worker starts; avoids the cold-start underrun flash.
+            self._prefetcher.prime_block(
+                self._playback_cursor,
+                self._playback_t_max or 0,
+                self.z_slider.value(),
+                self.loop_playback,
+            )
+            self._prefetcher.resume()
+        self._paused_at = None
         self._start_playback_thread()
+        self._playback_status_timer.start()
         self._update_status()
 
+    @QtCore.pyqtSlot()
     def stop_playback_t(self) -> None:
-        """Stop playback and clear prefetch buffer."""
+        """Stop playback and clear prefetch buffer.
+
+        Also queued from the playback thread when the stack runs out, so it
+        must stay invokable through the QMetaObject.
+        """
         if not self._playback_mode:
             return
         self._playback_mode = False
         self.play_mode = None
         self._playback_stop_event.set()
         if self._playback_thread is not None:
-            self._playback_thread.join(timeout=1.0)
+            self._playback_thread.wait(1000)
         self._playback_thread = None
         self._playback_stop_event.clear()
-        self._playback_ring.reset()
-        self._prefetcher.stop()
+        # Sync the T slider to the last displayed frame: the blitted path
+        # never moves it, so without this the UI keeps the pre-play
+        # position and start_playback_t — which rebuilds its cursor from
+        # the slider — would resume from the wrong frame.
+        last_t = min(self._playback_cursor, self.t_slider.maximum())
+        self._playback_cursor = last_t
+        blocker = QtCore.QSignalBlocker(self.t_slider)
+        self.t_slider.setValue(last_t)
+        del blocker
+        # Keep the ring warm across a pause; a resume at the same cursor,
+        # Z and display mapping reuses the queued frames instead of
+        # re-reading the block.
+        self._paused_at = (
+            last_t,
+            self._playback_z_cached,
+            self._playback_lut_key(),
+        )
+        self._prefetcher.pause()
+        self._playback_status_timer.stop()
+        self._release_frame_background()
         self._update_status()
 
     def _start_playback_thread(self) -> None:
         if self._playback_thread is not None:
             return
-        self._playback_thread = threading.Thread(target=self._playback_tick, daemon=True)
-        self._playback_thread.start()
+        self._playback_thread = _PlaybackThread(self)
+        self._playback_thread.start(QtCore.QThread.TimeCriticalPriority)
 
     def _playback_tick(self) -> None:
-        self._last_frame_time = time.monotonic()
+        self._last_frame_ns = self._elapsed.nsecsElapsed()
+        deadline = time.monotonic()
+        # Adaptive prefetch window: grow the block size while underruns
+        # accumulate, shrink it back once the ring stays comfortably full.
+        frames_since_adapt = 0
+        last_underruns = self._playback_underruns
+        full_cycles = 0
         while self._playback_mode:
-            fps = max(1, self.speed_slider.value())
-            sleep_time = 1.0 / fps
-            frame = self._playback_ring.pop(timeout=sleep_time)
-            if frame is None:
+            frames_since_adapt += 1
+            if frames_since_adapt >= 64:
+                frames_since_adapt = 0
+                bs = self._prefetcher.block_size
+                if self._playback_underruns > last_underruns:
+                    self._prefetcher.set_block_size(min(256, bs * 2))
+                    full_cycles = 0
+                else:
+                    stats = self._playback_ring.stats()
+                    if stats.filled >= 0.8 * stats.capacity:
+                        full_cycles += 1
+                        if full_cycles >= 4:
+                            self._prefetcher.set_block_size(max(8, bs // 2))
+                            full_cycles = 0
+                    else:
+                        full_cycles = 0
+                last_underruns = self._playback_underruns
+            fps = max(1, self._playback_fps_cached)
+            period = 1.0 / fps
+            # Batch the dequeue when the buffer is comfortably ahead; one
+            # lock acquisition then serves several frames. Low-FPS runs keep
+            # the one-at-a-time behavior.
+            batch_n = min(4, max(1, fps // 15))
+            if batch_n > 1 and self._playback_ring.stats().filled < batch_n:
+                batch_n = 1
+            batch = self._playback_ring.pop_batch(batch_n, timeout=period)
+            if not batch:
+                if (
+                    not self.loop_playback
+                    and self._prefetcher.finished()
+                    and self._playback_ring.is_empty()
+                ):
+                    # End of stack: the reader has parked and the buffered
+                    # tail is fully drained — not an underrun. Leave
+                    # playback mode from the GUI thread.
+                    QtCore.QMetaObject.invokeMethod(
+                        self, "stop_playback_t", QtCore.Qt.QueuedConnection
+                    )
+                    return
                 self._playback_underruns += 1
                 self._flash_status("Buffer underrun")
                 QtCore.QMetaObject.invokeMethod(
-                    self, "_update_buffer_stats", QtCore.Qt.QueuedConnection
+                    self._buffer_stats_timer, "start", QtCore.Qt.QueuedConnection
                 )
-                time.sleep(sleep_time)
+                if self._playback_stop_event.wait(period) and not self._playback_mode:
+                    break
+                deadline = time.monotonic()
                 continue
-            self._playback_cursor += 1
-            QtCore.QMetaObject.invokeMethod(
-                self,
-                "_update_frame_only",
-                QtCore.Qt.QueuedConnection,
-                QtCore.Q_ARG(object, frame),
-                QtCore.Q_ARG(int, self._playback_cursor),
+            for _t_idx, frame in batch:
+                if not self._playback_mode:
+                    break
+                self._playback_cursor += 1
+                # Publish to the latest-frame slot; post a refresh only when
+                # none is pending so bursts coalesce to a single invocation.
+                with self._latest_frame_lock:
+                    self._latest_frame = (frame, self._playback_cursor)
+                    pending = self._refresh_pending
+                    self._refresh_pending = True
+                if not pending:
+                    QtCore.QMetaObject.invokeMethod(
+                        self, "_drain_latest_frame", QtCore.Qt.QueuedConnection
+                    )
+                if self.loop_playback and self._playback_t_max is not None:
+                    t_max = self._playback_t_max
+                    if self._playback_cursor > t_max:
+                        self._playback_cursor = 0
+                        self._playback_ring.reset()
+                        # Re-aim the already-running worker at the wrap
+                        # point; request_jump prefetches from current_t + 1.
+                        self._prefetcher.request_jump(
+                            self._playback_cursor - 1,
+                            t_max,
+                            self._playback_z_cached,
+                            self.loop_playback,
+                        )
+                self._last_frame_ns = self._elapsed.nsecsElapsed()
+                if DEBUG_FPS:
+                    self._update_fps_meter()
+                # Deadline scheduler: sleep only the residual so dispatch
+                # time doesn't eat into the frame period, and resync instead
+                # of racing when more than two periods behind. Waiting on the
+                # stop event lets stop_playback_t wake the thread instantly.
+                deadline += period
+                now = time.monotonic()
+                if now - deadline > 2.0 * period:
+                    deadline = now
+                    self._playback_frames_skipped += 1
+                else:
+                    residual = deadline - now
+                    if (
+                        residual > 0
+                        and self._playback_stop_event.wait(residual)
+                        and not self._playback_mode
+                    ):
+                        return
+
+    def _playback_lut_key(self) -> tuple:
+        """Fingerprint of the display mapping baked into queued RGBA frames.
+
+        Quantized the same way as the :func:`build_lut_u8` cache key, so
+        two states compare equal exactly when they produce the same LUT.
+        """
+        mapping = self._get_display_mapping(self.primary_image.id, "frame", None)
+        return (
+            mapping.lut,
+            bool(mapping.invert),
+            mapping.mode,
+            round(mapping.min_val * 1000),
+            round(mapping.max_val * 1000),
+            round(mapping.gamma * 1000),
+        )
+
+    def _playback_lut_u8(self):
+        """Return ``(lut, vmin, vmax)`` for the frame panel's display mapping.
+
+        Delegates to the ``lru_cache``'d :func:`~phage_annotator.fast_render.build_lut_u8`,
+        so repeated mappings — including slider jitter within 1e-3 — are O(1) hits.
+        """
+        mapping = self._get_display_mapping(self.primary_image.id, "frame", None)
+        lut = build_lut_u8(
+            LUTS[mapping.lut % len(LUTS)],
+            bool(mapping.invert),
+            mapping.mode,
+            round(mapping.min_val * 1000),
+            round(mapping.max_val * 1000),
+            round(mapping.gamma * 1000),
+        )
+        return lut, float(mapping.min_val), float(mapping.max_val)
+
+    def _apply_playback_lut(self, block: np.ndarray) -> np.ndarray:
+        """Map raw frames to RGBA uint8 through the cached LUT."""
+        if block.size == 0:
+            return block
+        lut, vmin, vmax = self._playback_lut_u8()
+        # Rotating RGBA block buffers: the ring stores views into these, so
+        # a buffer must not be rewritten until every frame it holds has left
+        # both the ring and the display. The prefetcher throttles at
+        # max_inflight queued blocks and the consumer can still hold frames
+        # from two older ones (the popped batch and the latest-frame slot),
+        # so cycling max_inflight + 3 buffers keeps the writer safely ahead
+        # without per-frame copies.
+        n_bufs = self._prefetcher.max_inflight_blocks + 3
+        if len(self._rgba_buffers) != n_bufs:
+            self._rgba_buffers = [None] * n_bufs
+            self._rgba_buf_idx = 0
+        out, self._playback_norm_out = fast_apply_lut(
+            block,
+            vmin,
+            vmax,
+            lut,
+            idx_out=self._playback_norm_out,
+            out=self._rgba_buffers[self._rgba_buf_idx],
+        )
+        self._rgba_buffers[self._rgba_buf_idx] = out
+        self._rgba_buf_idx = (self._rgba_buf_idx + 1) % n_bufs
+        return out
+
+    def _capture_frame_background(self) -> None:
+        """Cache the static frame-axes background for per-frame blitting.
+
+        Also snapshots the hot render objects into ``self._p`` so the
+        per-frame path does single-slot reads.
+        """
+        p = self._p
+        p.im_artist = self.im_frame
+        p.ax = self.ax_frame
+        p.canvas = self.canvas
+        # With the FPS meter disabled no text artist exists, so the blit loop
+        # redraws the image alone; text layout never enters the frame path.
+        p.fps_text = self._fps_text if DEBUG_FPS else None
+        if p.ax is None or p.im_artist is None:
+            p.bg = None
+            return
+        p.im_artist.set_animated(True)
+        if p.fps_text is not None:
+            p.fps_text.set_animated(True)
+        if p.title_text is None:
+            # Animated stand-in for the axes title so per-frame T updates do
+            # not force a full figure redraw.
+            p.ax.set_title("")
+            p.title_text = p.ax.text(
+                0.5,
+                1.01,
+                "",
+                transform=p.ax.transAxes,
+                ha="center",
+                va="bottom",
+                animated=True,
             )
-            if self.loop_playback and self.primary_image.array is not None:
-                t_max = self.primary_image.array.shape[0] - 1
-                if self._playback_cursor > t_max:
-                    self._playback_cursor = 0
-                    self._playback_ring.reset()
-                    self._prefetcher.start(self._playback_cursor, self.z_slider.value())
-            self._last_frame_time = time.monotonic()
-            if DEBUG_FPS:
-                self._update_fps_meter()
-            time.sleep(sleep_time)
+        p.canvas.draw()
+        p.bg = p.canvas.copy_from_bbox(p.ax.bbox)
+
+    def _release_frame_background(self) -> None:
+        """Drop the blit background and restore normal draw behavior."""
+        p = self._p
+        p.bg = None
+        if p.im_artist is not None:
+            p.im_artist.set_animated(False)
+        if p.fps_text is not None:
+            p.fps_text.set_animated(False)
+        if p.title_text is not None:
+            p.title_text.remove()
+            p.title_text = None
+        p.im_artist = None
+        p.ax = None
+        p.canvas = None
+        p.fps_text = None
+
+    def _invalidate_playback_bounds(self) -> None:
+        """Drop the cached T bound; recomputed on the next playback start."""
+        self._playback_t_max = None
+
+    def _on_canvas_resize(self, _event) -> None:
+        """Invalidate the cached blit background; it is recaptured lazily."""
+        self._p.bg = None
+
+    @QtCore.pyqtSlot()
+    def _drain_latest_frame(self) -> None:
+        """Render the most recent published frame on the GUI thread.
+
+        Intermediate frames that arrived while a refresh was pending are
+        dropped instead of queued — last value wins. The slot decoration
+        registers the method in the QMetaObject; invokeMethod by name
+        cannot reach a plain Python method.
+        """
+        with self._latest_frame_lock:
+            latest = self._latest_frame
+            self._latest_frame = None
+            self._refresh_pending = False
+        if latest is None:
+            return
+        frame, t_idx = latest
+        self._update_frame_only(frame, t_idx)
 
     def _update_frame_only(self, frame: np.ndarray, t_idx: int) -> None:
         if not self._playback_mode:
             return
-        if self.im_frame is None:
+        p = self._p
+        if p.bg is None or p.im_artist is not self.im_frame:
+            self._capture_frame_background()
+        if p.im_artist is None:
             return
-        self.im_frame.set_data(frame)
-        if self.ax_frame is not None:
-            self.ax_frame.set_title(f"Frame (T={t_idx})")
-        self._update_status()
-        self.canvas.draw_idle()
+        p.im_artist.set_data(frame)
+        if p.bg is not None and p.ax is not None:
+            if p.title_text is not None:
+                p.title_text.set_text(f"Frame (T={t_idx})")
+            # Blit fast path: restore cached background and redraw only the
+            # animated artists instead of the whole figure.
+            p.canvas.restore_region(p.bg)
+            p.ax.draw_artist(p.im_artist)
+            if p.title_text is not None:
+                p.ax.draw_artist(p.title_text)
+            if p.fps_text is not None:
+                p.ax.draw_artist(p.fps_text)
+            p.canvas.blit(p.ax.bbox)
+            p.canvas.flush_events()
+        else:
+            if p.ax is not None:
+                p.ax.set_title(f"Frame (T={t_idx})")
+            self.canvas.draw_idle()
+        # Status-bar updates run on the 5 Hz playback status timer, not here.
 
     def _update_fps_meter(self) -> None:
         if self._playback_frame_counter % FPS_UPDATE_STRIDE == 0:
-            now = time.monotonic()
-            if self._last_frame_time is not None:
-                dt = now - self._last_frame_time
-                if dt > 0:
-                    self._fps_times.append(1.0 / dt)
+            # QElapsedTimer is a raw performance-counter read; cheaper than a
+            # time.monotonic() call on every sampled frame. Stay in integer
+            # nanoseconds until the final division.
+            if self._last_frame_ns is not None:
+                dt_ns = self._elapsed.nsecsElapsed() - self._last_frame_ns
+                if dt_ns > 0:
+                    # O(1) ring update: evict the overwritten slot from the
+                    # running sum instead of re-summing the window.
+                    head = self._fps_head
+                    self._fps_sum -= self._fps_buf[head]
+                    self._fps_buf[head] = 1e9 / dt_ns
+                    self._fps_sum += self._fps_buf[head]
+                    self._fps_head = (head + 1) % self._fps_buf.shape[0]
+                    self._fps_fill = min(self._fps_fill + 1, self._fps_buf.shape[0])
         self._playback_frame_counter += 1
+        if not DEBUG_FPS:
+            return
         if self._fps_text is None and self.ax_frame is not None:
             self._fps_text = self.ax_frame.text(
                 0.02, 0.98, "", transform=self.ax_frame.transAxes, color="w"
             )
-        if self._fps_text is not None and self._fps_times:
-            fps = sum(self._fps_times) / len(self._fps_times)
-            self._fps_text.set_text(f"FPS: {fps:.1f}")
+        if self._fps_text is not None and self._fps_fill:
+            fps = self._fps_sum / self._fps_fill
+            # Text layout is the expensive part; skip it unless the displayed
+            # value actually changed at one-decimal precision.
+            text = f"FPS: {fps:.1f}"
+            if text != self._fps_last_str:
+                self._fps_last_str = text
+                self._fps_text.set_text(text)
 
     def _step_slider(self, slider: QtWidgets.QSlider, direction: int) -> None:
         value = slider.value() + direction
@@ -32,17 +32,102 @@ Thread Safety
 
 from __future__ import annotations
 
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 from matplotlib import pyplot as plt
 
-from phage_annotator.display_mapping import DisplayMapping, build_norm
+from phage_annotator.display_mapping import DisplayMapping, build_norm_cached
 from phage_annotator.lut_manager import LUTS, cmap_for
-from phage_annotator.render_mpl import RenderContext
+from phage_annotator.render_mpl import PanelBundle, RenderContext
 from phage_annotator.scalebar import ScaleBarSpec, compute_scalebar
 
+# Shared "no crop" cache key; avoids minting a fresh tuple per refresh.
+_ZERO_CROP = (0, 0, 0, 0)
+
+try:
+    # Single C loop with rescaled bin indices; roughly an order of
+    # magnitude faster than np.histogram on megapixel samples.
+    from fast_histogram import histogram1d as _fast_histogram1d
+
+    HAVE_FAST_HISTOGRAM = True
+except ImportError:
+    HAVE_FAST_HISTOGRAM = False
+
+
+def _binned_hist(vals: np.ndarray, bins: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Histogram counts/centers over uniform bins.
+
+    Integer data within a uint16-scale span goes through a direct
+    per-level ``np.bincount`` folded into the requested bins. Float data
+    uses ``fast_histogram`` when installed, otherwise quantizes to integer
+    bin indices and counts with ``np.bincount`` in one vectorized pass,
+    still several times faster than ``np.histogram`` on large flattened
+    frames. Falls back to ``np.histogram`` for degenerate ranges.
+    """
+    if vals.size == 0:
+        counts, edges = np.histogram(vals, bins=bins)
+        return counts, 0.5 * (edges[:-1] + edges[1:])
+    vmin = float(vals.min())
+    vmax = float(vals.max())
+    if not np.isfinite(vmin) or not np.isfinite(vmax) or vmax <= vmin:
+        counts, edges = np.histogram(vals, bins=bins)
+        return counts, 0.5 * (edges[:-1] + edges[1:])
+    if vals.dtype.kind in "iu":
+        # Raw camera data: count every intensity level with one bincount
+        # pass (a tight C loop at memory bandwidth) and fold contiguous
+        # runs of levels into the requested bins. Only applies when the
+        # level span is modest (uint8/uint16-scale) and divides cleanly.
+        lo, hi = int(vmin), int(vmax)
+        span = hi - lo + 1
+        if lo >= 0 and span <= 65536 and span % bins == 0:
+            width = span // bins
+            # Count the lo-shifted values so the table is span-sized; a
+            # bincount over 0..hi would allocate proportionally to the
+            # offset for data clustered far from zero.
+            full = np.bincount(vals.ravel() - lo, minlength=span)
+            counts = full.reshape(bins, width).sum(axis=1)
+            centers = lo + (np.arange(bins) + 0.5) * width
+            return counts, centers
+    width = (vmax - vmin) / bins
+    centers = vmin + (np.arange(bins) + 0.5) * width
+    if HAVE_FAST_HISTOGRAM:
+        counts = _fast_histogram1d(vals.ravel(), bins=bins, range=(vmin, vmax))
+        return counts, centers
+    scale = bins / (vmax - vmin)
+    idx = ((vals.ravel() - vmin) * scale).astype(np.uint16 if bins <= 65536 else np.intp)
+    np.clip(idx, 0, bins - 1, out=idx)
+    counts = np.bincount(idx, minlength=bins)[:bins]
+    return counts, centers
+
+
+def _hist_stats(
+    counts: np.ndarray, centers: np.ndarray, vmin: float, vmax: float
+) -> Tuple[float, float, float, int, int]:
+    """Summary statistics derived from an already-computed histogram.
+
+    Returns ``(mean, median, std, sat_low, sat_high)`` from histogram-
+    weighted moments and the bin CDF in O(bins), replacing five full
+    passes over the sample array (median alone partitions the whole
+    array). Bin-center resolution is plenty for a status-bar readout.
+    """
+    total = float(counts.sum())
+    if total <= 0:
+        return 0.0, 0.0, 0.0, 0, 0
+    counts_f = counts.astype(np.float64, copy=False)
+    mean = float(np.dot(centers, counts_f) / total)
+    var = float(np.dot(centers * centers, counts_f) / total) - mean * mean
+    std = float(np.sqrt(max(var, 0.0)))
+    cdf = np.cumsum(counts_f)
+    median_idx = int(np.searchsorted(cdf, 0.5 * total))
+    median = float(centers[min(median_idx, len(centers) - 1)])
+    sat_low = int(counts_f[centers < vmin].sum())
+    sat_high = int(counts_f[centers > vmax].sum())
+    return mean, median, std, sat_low, sat_high
+
 
 class RenderingMixin:
     """Mixin for image rendering and overlay composition."""
@@ -74,36 +159,31 @@ class RenderingMixin:
         self._ensure_loaded(self.support_image_idx)
         if prim.array is None:
             return
+        if self.im_frame is not None and self._full_refresh_signature() == self._last_full_sig:
+            return
         self._capture_zoom_state()
         t_idx, z_idx = self._slice_indices(prim)
         slice_data = self._slice_data(prim)
         support_slice = self._slice_data(supp) if supp.array is not None else None
         crop_rect = self.crop_rect
         if crop_rect:
-            slice_data = self._apply_crop_rect(
-                slice_data, crop_rect, (slice_data.shape[0], slice_data.shape[1])
-            )
+            slice_data = self._apply_crop_rect(slice_data, crop_rect)
             if support_slice is not None:
-                support_slice = self._apply_crop_rect(
-                    support_slice,
-                    crop_rect,
-                    (support_slice.shape[0], support_slice.shape[1]),
-                )
+                support_slice = self._apply_crop_rect(support_slice, crop_rect)
         if self._binary_view_enabled and self._binary_view_mask is not None:
             mask = self._binary_view_mask
             if crop_rect:
-                mask = self._apply_crop_rect(mask, crop_rect, mask.shape)
-            slice_data = mask.astype(np.float32, copy=False)
+                mask = self._apply_crop_rect(mask, crop_rect)
+            # uint8 instead of float32: a quarter of the bytes through
+            # pool/crop/norm, and unlike bool it stays arithmetic-safe for
+            # the histogram diagnostics.
+            slice_data = mask.astype(np.uint8, copy=False)
 
+        # Projections that have not arrived stay None; the renderer skips
+        # those artists rather than displaying a throwaway zero buffer.
         mean_data, mean_ready = self._get_projection(prim, "mean")
         std_data, std_ready = self._get_projection(prim, "std")
         comp_data, comp_ready = self._get_projection(prim, "composite")
-        if mean_data is None:
-            mean_data = np.zeros_like(slice_data)
-        if std_data is None:
-            std_data = np.zeros_like(slice_data)
-        if comp_data is None:
-            comp_data = np.zeros_like(slice_data)
 
         # Interactive downsampling (display-only).
         slice_display = slice_data
@@ -117,42 +197,47 @@ class RenderingMixin:
             if level > 0:
                 scale = 2**level
                 self._render_scales = {ax: scale for ax in self.renderer.axes.values()}
+                # One hashable crop key shared by all five pyramid lookups.
+                crop_key = tuple(crop_rect) if crop_rect else _ZERO_CROP
                 slice_display = self._get_pyramid_display(
                     prim.id,
                     "frame",
                     slice_data,
                     t_idx,
                     z_idx,
-                    self.crop_rect or (0, 0, 0, 0),
-                    level,
-                )
-                mean_display = self._get_pyramid_display(
-                    prim.id,
-                    "mean",
-                    mean_data,
-                    -1,
-                    -1,
-                    self.crop_rect or (0, 0, 0, 0),
-                    level,
-                )
-                std_display = self._get_pyramid_display(
-                    prim.id,
-                    "std",
-                    std_data,
-                    -1,
-                    -1,
-                    self.crop_rect or (0, 0, 0, 0),
-                    level,
-                )
-                comp_display = self._get_pyramid_display(
-                    prim.id,
-                    "composite",
-                    comp_data,
-                    -1,
-                    -1,
-                    self.crop_rect or (0, 0, 0, 0),
+                    crop_key,
                     level,
                 )
+                if mean_data is not None:
+                    mean_display = self._get_pyramid_display(
+                        prim.id,
+                        "mean",
+                        mean_data,
+                        -1,
+                        -1,
+                        crop_key,
+                        level,
+                    )
+                if std_data is not None:
+                    std_display = self._get_pyramid_display(
+                        prim.id,
+                        "std",
+                        std_data,
+                        -1,
+                        -1,
+                        crop_key,
+                        level,
+                    )
+                if comp_data is not None:
+                    comp_display = self._get_pyramid_display(
+                        prim.id,
+                        "composite",
+                        comp_data,
+                        -1,
+                        -1,
+                        crop_key,
+                        level,
+                    )
                 if support_slice is not None:
                     support_display = self._get_pyramid_display(
                         supp.id,
@@ -160,7 +245,7 @@ class RenderingMixin:
                         support_slice,
                         t_idx,
                         z_idx,
-                        self.crop_rect or (0, 0, 0, 0),
+                        crop_key,
                         level,
                     )
             else:
@@ -169,14 +254,14 @@ class RenderingMixin:
             self._render_scales = {ax: 1.0 for ax in self.renderer.axes.values()}
 
         vmin, vmax = self._current_vmin_vmax()
-        titles = {
-            "frame": f"Frame (T={t_idx}, Z={z_idx})",
-            "mean": "Mean Projection",
-            "composite": "Composite",
-            "support": f"Support (T={t_idx}, Z={z_idx})",
-            "std": "Std Projection",
-        }
-        extents = {}
+        titles = PanelBundle(
+            frame=f"Frame (T={t_idx}, Z={z_idx})",
+            mean="Mean Projection",
+            composite="Composite",
+            support=f"Support (T={t_idx}, Z={z_idx})",
+            std="Std Projection",
+        )
+        extents = PanelBundle()
         for key, data in [
             ("frame", slice_display),
             ("mean", mean_display),
@@ -186,7 +271,7 @@ class RenderingMixin:
         ]:
             if data is None:
                 continue
-            extents[key] = (0, data.shape[1], data.shape[0], 0)
+            setattr(extents, key, (0, data.shape[1], data.shape[0], 0))
         panel_annotations = self._build_panel_annotations()
         roi_overlays = self._build_roi_overlays()
         overlay_text = self._build_overlay_text()
@@ -204,22 +289,13 @@ class RenderingMixin:
         std_mapping = self._get_display_mapping(prim.id, "std", std_data)
         support_mapping = self._get_display_mapping(supp.id, "support", support_slice)
         std_vmin, std_vmax = std_mapping.min_val, std_mapping.max_val
-        if self._playback_mode:
-            norms = {
-                "frame": self._norm_cached("frame", frame_mapping),
-                "mean": self._norm_cached("mean", mean_mapping),
-                "composite": self._norm_cached("composite", comp_mapping),
-                "support": self._norm_cached("support", support_mapping),
-                "std": self._norm_cached("std", std_mapping),
-            }
-        else:
-            norms = {
-                "frame": build_norm(frame_mapping),
-                "mean": build_norm(mean_mapping),
-                "composite": build_norm(comp_mapping),
-                "support": build_norm(support_mapping),
-                "std": build_norm(std_mapping),
-            }
+        norms = PanelBundle(
+            frame=self._norm_cached(frame_mapping),
+            mean=self._norm_cached(mean_mapping),
+            composite=self._norm_cached(comp_mapping),
+            support=self._norm_cached(support_mapping),
+            std=self._norm_cached(std_mapping),
+        )
 
         def _spec(idx: int):
             if idx < 0:
@@ -228,13 +304,13 @@ class RenderingMixin:
                 return LUTS[-1]
             return LUTS[idx]
 
-        panel_cmaps = {
-            "frame": cmap_for(_spec(frame_mapping.lut), frame_mapping.invert),
-            "mean": cmap_for(_spec(mean_mapping.lut), mean_mapping.invert),
-            "composite": cmap_for(_spec(comp_mapping.lut), comp_mapping.invert),
-            "support": cmap_for(_spec(support_mapping.lut), support_mapping.invert),
-            "std": cmap_for(_spec(std_mapping.lut), std_mapping.invert),
-        }
+        panel_cmaps = PanelBundle(
+            frame=cmap_for(_spec(frame_mapping.lut), frame_mapping.invert),
+            mean=cmap_for(_spec(mean_mapping.lut), mean_mapping.invert),
+            composite=cmap_for(_spec(comp_mapping.lut), comp_mapping.invert),
+            support=cmap_for(_spec(support_mapping.lut), support_mapping.invert),
+            std=cmap_for(_spec(std_mapping.lut), std_mapping.invert),
+        )
         overlay_frame = None
         overlay_extent = None
         if self.show_sr_overlay:
@@ -247,27 +323,44 @@ class RenderingMixin:
         # Validate density overlay is for current image
         current_img_id = self.primary_image.id if hasattr(self, 'primary_image') else -1
         density_img_id = getattr(self, '_density_image_id', None)
+        overlay_pooled = False
         if self._density_overlay is not None and density_img_id == current_img_id:
             density = self._density_overlay
+            x0, y0 = 0, 0
+            y1, x1 = density.shape[:2]
             if self.crop_rect:
                 x, y, w, h = self.crop_rect
                 x0 = int(max(0, x))
                 y0 = int(max(0, y))
                 x1 = int(min(density.shape[1], x + w))
                 y1 = int(min(density.shape[0], y + h))
-                density = density[y0:y1, x0:x1]
-            overlay_frame = density
-            overlay_extent = (0, density.shape[1], density.shape[0], 0)
-        if overlay_frame is not None and self._interactive and self.downsample_images:
+            stride = 1
+            if self._interactive and self.downsample_images:
+                stride = max(1, int(self.downsample_factor))
+            if stride > 1 and x1 > x0 and y1 > y0:
+                # Summed-area table turns crop + downsample into four reads
+                # per output pixel, independent of crop size, and yields
+                # alias-free block means instead of a strided subsample.
+                overlay_frame = self._pooled_density_overlay(density, x0, y0, x1, y1, stride)
+                overlay_pooled = True
+            else:
+                overlay_frame = density[y0:y1, x0:x1]
+            overlay_extent = (0, x1 - x0, y1 - y0, 0)
+        if (
+            overlay_frame is not None
+            and not overlay_pooled
+            and self._interactive
+            and self.downsample_images
+        ):
             stride = max(1, int(self.downsample_factor))
             overlay_frame = overlay_frame[::stride, ::stride]
-        loc_points = []
+        loc_points = None
         if self.show_smlm_points and self.ax_frame is not None:
             # Validate that results are for the current image
             current_img_id = self.primary_image.id if hasattr(self, 'primary_image') else -1
             smlm_img_id = getattr(self, '_smlm_image_id', None)
             deepstorm_img_id = getattr(self, '_deepstorm_image_id', None)
-            
+
             scale = self._axis_scale(self.ax_frame)
             off_x = self.crop_rect[0] if self.crop_rect else 0.0
             off_y = self.crop_rect[1] if self.crop_rect else 0.0
@@ -276,31 +369,19 @@ class RenderingMixin:
                 color_field = "photons"
                 if color_mode is not None and hasattr(color_mode, "color_mode_combo"):
                     color_field = color_mode.color_mode_combo.currentText().lower()
-                for loc in self._smlm_results:
-                    val = loc.photons if color_field.startswith("phot") else loc.uncertainty_px
-                    loc_points.append(
-                        (
-                            (loc.x_px - off_x) / scale,
-                            (loc.y_px - off_y) / scale,
-                            float(val),
-                        )
-                    )
+                xy, photons, unc = self._smlm_loc_arrays()
+                vals = photons if color_field.startswith("phot") else unc
+                loc_points = self._project_loc_points(xy, vals, off_x, off_y, scale)
             elif self._deepstorm_results and deepstorm_img_id == current_img_id:
-                for loc in self._deepstorm_results:
-                    loc_points.append(
-                        (
-                            (loc.x_px - off_x) / scale,
-                            (loc.y_px - off_y) / scale,
-                            float(loc.score),
-                        )
-                    )
-        panel_ranges = {
-            "frame": (frame_mapping.min_val, frame_mapping.max_val),
-            "mean": (mean_mapping.min_val, mean_mapping.max_val),
-            "composite": (comp_mapping.min_val, comp_mapping.max_val),
-            "support": (support_mapping.min_val, support_mapping.max_val),
-            "std": (std_mapping.min_val, std_mapping.max_val),
-        }
+                xy, score = self._deepstorm_loc_arrays()
+                loc_points = self._project_loc_points(xy, score, off_x, off_y, scale)
+        panel_ranges = PanelBundle(
+            frame=(frame_mapping.min_val, frame_mapping.max_val),
+            mean=(mean_mapping.min_val, mean_mapping.max_val),
+            composite=(comp_mapping.min_val, comp_mapping.max_val),
+            support=(support_mapping.min_val, support_mapping.max_val),
+            std=(std_mapping.min_val, std_mapping.max_val),
+        )
         scale_bar = None
         scale_bar_warning = None
         if self.scale_bar_enabled:
@@ -316,7 +397,7 @@ class RenderingMixin:
                     text_offset_px=self.scale_bar_text_offset_px,
                     background_box=self.scale_bar_background_box,
                 )
-                extent = extents.get("frame") or (
+                extent = extents.frame or (
                     0,
                     slice_display.shape[1],
                     slice_display.shape[0],
@@ -350,7 +431,7 @@ class RenderingMixin:
             panel_cmaps=panel_cmaps,
             panel_ranges=panel_ranges,
             localization_points=loc_points,
-            localization_visible=bool(loc_points),
+            localization_visible=loc_points is not None and loc_points.size > 0,
             threshold_mask=(
                 self._threshold_preview_mask if self._threshold_preview_mask is not None else None
             ),
@@ -365,9 +446,7 @@ class RenderingMixin:
             ),
             overlay_norm=None,
             overlay_cmap=(
-                plt.get_cmap(self._density_overlay_cmap)
-                if self._density_overlay is not None
-                else None
+                self._density_cmap_obj() if self._density_overlay is not None else None
             ),
             density_contours=bool(self._density_contours),
             scale_bar=scale_bar,
@@ -385,7 +464,7 @@ class RenderingMixin:
         self.im_comp = self.renderer.image_artists.get("composite")
         self.im_support = self.renderer.image_artists.get("support")
         self.im_std = self.renderer.image_artists.get("std")
-        self._refresh_orthoview(prim, t_idx, z_idx, norms["frame"], panel_cmaps["frame"])
+        self._refresh_orthoview(prim, t_idx, z_idx, norms.frame, panel_cmaps.frame)
         if self.ax_mean is not None and not mean_ready:
             self.ax_mean.text(
                 0.5,
@@ -444,8 +523,211 @@ class RenderingMixin:
             self.log_chk.blockSignals(False)
         if self.render_level_label is not None:
             self.render_level_label.setText(f"Render: L{level}")
+        self._last_refresh_sig = self._refresh_signature()
+        # Recompute after the refresh: mappings may have been auto-created
+        # and projections scheduled while rendering.
+        self._last_full_sig = self._full_refresh_signature()
         self._update_status()
 
+    def _density_cmap_obj(self):
+        """Resolved density-overlay colormap, cached until the name changes.
+
+        ``plt.get_cmap`` scans the registry and builds a Colormap each
+        call; doing that once per overlay-cmap selection instead of once
+        per refresh keeps it off the redraw path.
+        """
+        name = self._density_overlay_cmap
+        if name != self._density_cmap_name:
+            self._density_cmap = plt.get_cmap(name)
+            self._density_cmap_name = name
+        return self._density_cmap
+
+    def _full_refresh_signature(self) -> tuple:
+        """Fingerprint of every input feeding ``_refresh_image``.
+
+        ``_refresh_image`` bails out when this matches the previous
+        refresh, so redundant redraw requests (focus changes, duplicate
+        slider signals) cost one tuple build instead of the full panel
+        pipeline. Anything that alters the rendered output must appear
+        here; when adding render state, extend this signature with it.
+        """
+        prim = self.primary_image
+        supp = self.support_image
+        t_idx, z_idx = self._slice_indices(prim)
+        ax = self.ax_frame
+        zoom = (ax.get_xlim(), ax.get_ylim()) if ax is not None else None
+        per_image = self.controller.display_mapping.per_image
+
+        def _mapping_sig(image_id: int) -> tuple:
+            panels = per_image.get(image_id)
+            if not panels:
+                return ()
+            return tuple(
+                (panel, m.min_val, m.max_val, m.gamma, m.mode, m.lut, m.invert)
+                for panel, m in panels.items()
+            )
+
+        projections = tuple(
+            id(self.proj_cache.get(self._projection_key(prim, kind)))
+            for kind in ("mean", "std", "composite")
+        )
+        keypoints = tuple(
+            (id(kp), kp.x, kp.y, kp.t, kp.z, kp.label)
+            for kp in self.annotations.get(prim.id, ())
+        )
+        roi_spec = self.controller.view_state.roi_spec
+        return (
+            prim.id,
+            supp.id if supp is not None else -1,
+            t_idx,
+            z_idx,
+            self.crop_rect,
+            zoom,
+            self._interactive,
+            self.downsample_images,
+            self.downsample_factor,
+            _mapping_sig(prim.id),
+            _mapping_sig(supp.id) if supp is not None else (),
+            projections,
+            keypoints,
+            id(self._table_rows),
+            len(self._table_rows),
+            self.roi_manager.version,
+            roi_spec.shape,
+            roi_spec.rect,
+            tuple(sorted(self._panel_visibility.items())),
+            self.overlay_enabled,
+            self.marker_size,
+            self.show_sr_overlay,
+            self.show_smlm_points,
+            id(self._sr_overlay),
+            id(self._smlm_overlay),
+            id(self._density_overlay),
+            self._density_overlay_alpha,
+            self._density_overlay_cmap,
+            self._density_contours,
+            getattr(self, "_density_image_id", None),
+            getattr(self, "_smlm_image_id", None),
+            getattr(self, "_deepstorm_image_id", None),
+            id(self._smlm_results),
+            id(self._deepstorm_results),
+            id(self._threshold_preview_mask),
+            id(self._particles_overlays),
+            len(self._particles_results),
+            self._binary_view_enabled,
+            id(self._binary_view_mask),
+            self.scale_bar_enabled,
+            (
+                self.scale_bar_length_um,
+                self.scale_bar_thickness_px,
+                self.scale_bar_location,
+                self.scale_bar_show_text,
+                self.scale_bar_background_box,
+            )
+            if self.scale_bar_enabled
+            else None,
+            self.pyramid_enabled,
+            self._last_render_level,
+            self.downsample_hist,
+            self.downsample_profile,
+            self.profile_enabled,
+            self.profile_line,
+            self.hist_enabled,
+            self.hist_region,
+            self.hist_bins,
+        )
+
+    def _refresh_signature(self) -> tuple:
+        """Render configuration fingerprint for the frame panel.
+
+        ``start_playback_t`` compares this against the value stored by the
+        last ``_refresh_image`` to decide whether a full refresh is needed
+        before blitted playback; repeated play/pause at unchanged settings
+        then skips the heavy redraw entirely.
+        """
+        vmin, vmax = self._current_vmin_vmax()
+        downsample = 1
+        if self._interactive and self.downsample_images:
+            downsample = max(1, int(self.downsample_factor))
+        return (
+            id(self.primary_image),
+            self.crop_rect,
+            downsample,
+            float(vmin),
+            float(vmax),
+        )
+
+    def _smlm_loc_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return SMLM localizations in SoA form (xy, photons, uncertainty).
+
+        Rebuilt only when the result list object changes; projecting thousands
+        of localizations then costs two vectorized operations per refresh
+        instead of a Python loop over tuples.
+        """
+        locs = self._smlm_results
+        if self._smlm_soa_id != id(locs):
+            self._smlm_xy_px = np.array(
+                [(l.x_px, l.y_px) for l in locs], dtype=np.float32
+            ).reshape(-1, 2)
+            self._smlm_photons = np.array([l.photons for l in locs], dtype=np.float32)
+            self._smlm_unc = np.array([l.uncertainty_px for l in locs], dtype=np.float32)
+            self._smlm_soa_id = id(locs)
+        return self._smlm_xy_px, self._smlm_photons, self._smlm_unc
+
+    def _deepstorm_loc_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return DeepSTORM localizations in SoA form (xy, score)."""
+        locs = self._deepstorm_results
+        if self._deepstorm_soa_id != id(locs):
+            self._deepstorm_xy_px = np.array(
+                [(l.x_px, l.y_px) for l in locs], dtype=np.float32
+            ).reshape(-1, 2)
+            self._deepstorm_score = np.array([l.score for l in locs], dtype=np.float32)
+            self._deepstorm_soa_id = id(locs)
+        return self._deepstorm_xy_px, self._deepstorm_score
+
+    @staticmethod
+    def _project_loc_points(
+        xy: np.ndarray, vals: np.ndarray, off_x: float, off_y: float, scale: float
+    ) -> np.ndarray:
+        """Map localization coordinates to display space as an (N, 3) array."""
+        out = np.empty((xy.shape[0], 3), dtype=np.float32)
+        np.subtract(xy, np.array([off_x, off_y], dtype=np.float32), out=out[:, :2])
+        out[:, :2] /= scale
+        out[:, 2] = vals
+        return out
+
+    def _density_sat_for(self, density: np.ndarray) -> np.ndarray:
+        """Return (building lazily) the summed-area table for the overlay.
+
+        The table is cached per overlay array and rebuilt only when a new
+        density map is assigned.
+        """
+        if self._density_sat is None or self._density_sat_id != id(density):
+            sat = np.zeros((density.shape[0] + 1, density.shape[1] + 1), dtype=np.float64)
+            np.cumsum(density, axis=0, out=sat[1:, 1:])
+            np.cumsum(sat[1:, 1:], axis=1, out=sat[1:, 1:])
+            self._density_sat = sat
+            self._density_sat_id = id(density)
+        return self._density_sat
+
+    def _pooled_density_overlay(
+        self, density: np.ndarray, x0: int, y0: int, x1: int, y1: int, stride: int
+    ) -> np.ndarray:
+        """Crop + mean-pool the density overlay via its summed-area table."""
+        sat = self._density_sat_for(density)
+        ys = np.arange(y0, y1, stride)
+        xs = np.arange(x0, x1, stride)
+        ye = np.minimum(ys + stride, y1)
+        xe = np.minimum(xs + stride, x1)
+        pooled = (
+            sat[np.ix_(ye, xe)]
+            - sat[np.ix_(ys, xe)]
+            - sat[np.ix_(ye, xs)]
+            + sat[np.ix_(ys, xs)]
+        )
+        pooled /= (ye - ys)[:, None] * (xe - xs)[None, :]
+        return pooled
+
     def _refresh_orthoview(self, prim, t_idx: int, z_idx: int, norm, cmap) -> None:
         if self.orthoview_widget is None:
             return
@@ -473,14 +755,31 @@ class RenderingMixin:
         x_full, y_full = self._cursor_xy
         x_idx = int(np.clip(round(x_full), 0, x_dim - 1))
         y_idx = int(np.clip(round(y_full), 0, y_dim - 1))
-        xz = stack[:, y_idx, :]
-        yz = stack[:, :, x_idx]
         downsample = 1
         if self._interactive and self.downsample_images:
             downsample = max(1, int(self.downsample_factor))
-            if downsample > 1:
-                xz = xz[::downsample, ::downsample]
-                yz = yz[::downsample, ::downsample]
+        # Re-slicing and repainting is pure waste when nothing feeding the
+        # ortho panes moved; for memmap-backed stacks the slice alone
+        # re-reads Z x X / Z x Y strips from disk.
+        key = (
+            id(prim.array),
+            t_idx,
+            z_idx,
+            y_idx,
+            x_idx,
+            downsample,
+            id(norm),
+            id(cmap),
+            self._playback_mode,
+        )
+        if key == self._ortho_cache_key:
+            return
+        self._ortho_cache_key = key
+        xz = stack[:, y_idx, :]
+        yz = stack[:, :, x_idx]
+        if downsample > 1:
+            xz = xz[::downsample, ::downsample]
+            yz = yz[::downsample, ::downsample]
         throttle_ms = 500 if self._playback_mode else None
         self.orthoview_widget.update_views(
             xz,
@@ -524,18 +823,37 @@ class RenderingMixin:
             return (0.0, 0.0)
         return (x_dim / 2.0, y_dim / 2.0)
 
+    def _particles_xy(self) -> np.ndarray:
+        """Particle centroids as an (N, 2) float32 array.
+
+        Mirrors the SoA caches for localizations: attribute access over
+        thousands of particle objects is the real per-refresh cost, so the
+        array is rebuilt only when the result list changes. Keyed on
+        ``(id, len)`` because incremental detection extends the list in
+        place.
+        """
+        results = self._particles_results
+        key = (id(results), len(results))
+        if self._particles_xy_key != key:
+            self._particles_xy_arr = np.array(
+                [(p.centroid_x, p.centroid_y) for p in results], dtype=np.float32
+            ).reshape(-1, 2)
+            self._particles_xy_key = key
+        return self._particles_xy_arr
+
     def _particle_labels(self) -> List[Tuple[float, float, str]]:
         if self.particles_panel is None:
             return []
         if not self.particles_panel.show_labels_chk.isChecked():
             return []
+        if not self._particles_results:
+            return []
         scale = self._axis_scale(self.ax_frame)
-        labels: List[Tuple[float, float, str]] = []
-        for idx, particle in enumerate(self._particles_results):
-            x = (particle.centroid_x - (self.crop_rect[0] if self.crop_rect else 0.0)) / scale
-            y = (particle.centroid_y - (self.crop_rect[1] if self.crop_rect else 0.0)) / scale
-            labels.append((x, y, str(idx + 1)))
-        return labels
+        off_x = self.crop_rect[0] if self.crop_rect else 0.0
+        off_y = self.crop_rect[1] if self.crop_rect else 0.0
+        xy = self._particles_xy() - np.array([off_x, off_y], dtype=np.float32)
+        xy /= np.float32(scale)
+        return [(float(x), float(y), str(i + 1)) for i, (x, y) in enumerate(xy)]
 
     def _build_panel_annotations(
         self,
@@ -568,15 +886,31 @@ class RenderingMixin:
         return panel_annotations
 
     def _build_roi_overlays(self) -> Dict[str, List[Tuple[str, object, str]]]:
+        # On the common refresh (only T/Z changed) every rectangle here is
+        # identical to the previous one; return the cached dict keyed on the
+        # ROI version, crop, and per-panel axis scales.
+        panels = ("frame", "mean", "composite", "support")
+        key = (
+            self.roi_manager.version,
+            self.primary_image.id,
+            tuple(self.crop_rect) if self.crop_rect else None,
+            tuple(
+                self._axis_scale(getattr(self, f"ax_{p}") or self.ax_frame) for p in panels
+            ),
+        )
+        if self._roi_overlays_cache_key == key:
+            return self._roi_overlays_cache
+        # Per-panel scales were already computed for the cache key; reuse
+        # them instead of re-resolving the axis per ROI per panel.
+        panel_scales = dict(zip(panels, key[3]))
         overlays: Dict[str, List[Tuple[str, object, str]]] = {
-            panel: [] for panel in ["frame", "mean", "composite", "support"]
+            panel: [] for panel in panels
         }
         for roi in self.roi_manager.list_rois(self.primary_image.id):
             if not roi.visible:
                 continue
             for panel in overlays:
-                ax = getattr(self, f"ax_{panel}") or self.ax_frame
-                scale = self._axis_scale(ax)
+                scale = panel_scales[panel]
                 if roi.roi_type == "circle" and len(roi.points) >= 2:
                     (cx, cy), (px, py) = roi.points[:2]
                     r = float(np.hypot(px - cx, py - cy))
@@ -613,12 +947,13 @@ class RenderingMixin:
                     overlays[panel].append((roi.roi_type, pts, roi.color))
         if self.crop_rect:
             for panel in overlays:
-                ax = getattr(self, f"ax_{panel}") or self.ax_frame
-                scale = self._axis_scale(ax)
+                scale = panel_scales[panel]
                 x, y, w, h = self.crop_rect
                 overlays[panel].append(
                     ("box", (x / scale, y / scale, w / scale, h / scale), "#00c0ff")
                 )
+        self._roi_overlays_cache_key = key
+        self._roi_overlays_cache = overlays
         return overlays
 
     def _build_overlay_text(self) -> Optional[str]:
@@ -648,8 +983,8 @@ class RenderingMixin:
             and self.roi_rect[3] > 0
         )
         roi_txt = "yes" if roi_active else "no"
-        crop_rect = self.crop_rect if self.crop_rect else (0, 0, 0, 0)
-        roi_rect = self.roi_rect if roi_active else (0, 0, 0, 0)
+        crop_rect = self.crop_rect if self.crop_rect else _ZERO_CROP
+        roi_rect = self.roi_rect if roi_active else _ZERO_CROP
         cal = self._get_calibration_state(img.id)
         pixel_size = (
             f"{cal.pixel_size_um_per_px:.4f} um/px" if cal.pixel_size_um_per_px else "unknown"
@@ -678,47 +1013,110 @@ class RenderingMixin:
         self.overlay_enabled = checked
         self._refresh_image()
 
-    def _draw_diagnostics(self, slice_data: np.ndarray, vmin: float, vmax: float) -> None:
-        """Update histogram and profile diagnostics."""
-        profile_visible = self.dock_profile is None or self.dock_profile.isVisible()
-        if (
+    def _ensure_profile_artists(self) -> None:
+        """Create the persistent line-profile artists once per axes.
+
+        ``ax.clear()`` + ``ax.plot()`` per refresh forced matplotlib to
+        rebuild the artist tree and re-run axes layout every time; keeping
+        one Line2D alive and feeding it ``set_data`` is what makes the
+        small diagnostic panels repaint-cheap.
+        """
+        if self._profile_curve is not None and self._profile_curve.axes is self.ax_line:
+            return
+        self.ax_line.clear()
+        (self._profile_curve,) = self.ax_line.plot([], [], color="#5555aa")
+        self.ax_line.set_xlabel("X")
+        self.ax_line.set_ylabel("Intensity")
+
+    def _ensure_hist_artists(self) -> None:
+        """Create the persistent histogram artists once per axes."""
+        if self._hist_curve is not None and self._hist_curve.axes is self.ax_hist:
+            return
+        self.ax_hist.clear()
+        (self._hist_curve,) = self.ax_hist.plot([], [], color="#5555aa")
+        self._hist_vmin_line = self.ax_hist.axvline(
+            0.0, color="#ff8800", linestyle="--", linewidth=1
+        )
+        self._hist_vmax_line = self.ax_hist.axvline(
+            0.0, color="#ff8800", linestyle="--", linewidth=1
+        )
+        self._hist_stats_text = self.ax_hist.text(
+            0.02,
+            0.95,
+            "",
+            transform=self.ax_hist.transAxes,
+            va="top",
+            fontsize=8,
+        )
+        self.ax_hist.set_title("Intensity histogram")
+        self.ax_hist.set_xlabel("Intensity")
+        self.ax_hist.set_ylabel("Count")
+
+    def _update_diag_live(self) -> None:
+        """Recompute whether the diagnostic panels are worth drawing.
+
+        The enabled/checked/dock-visible conjunction only changes on
+        explicit toggles, so it is snapshotted into two booleans here
+        (called from the checkbox handlers and the dock visibility sync)
+        instead of re-querying Qt widget state on every refresh.
+        """
+        self._profile_live = bool(
             self.profile_enabled
+            and self.profile_chk is not None
             and self.profile_chk.isChecked()
-            and profile_visible
+            and (self.dock_profile is None or self.dock_profile.isVisible())
             and self.ax_line is not None
-        ):
-            self.ax_line.clear()
+        )
+        self._hist_live = bool(
+            self.hist_enabled
+            and self.hist_chk is not None
+            and self.hist_chk.isChecked()
+            and (self.dock_hist is None or self.dock_hist.isVisible())
+            and self.ax_hist is not None
+        )
+
+    def _draw_diagnostics(self, slice_data: np.ndarray, vmin: float, vmax: float) -> None:
+        """Update histogram and profile diagnostics."""
+        if self._profile_live:
+            self._ensure_profile_artists()
             if self.profile_line:
                 (y1, x1), (y2, x2) = self.profile_line
-                yy, xx = np.linspace(y1, y2, 200), np.linspace(x1, x2, 200)
-                vals = slice_data[
-                    yy.astype(int).clip(0, slice_data.shape[0] - 1),
-                    xx.astype(int).clip(0, slice_data.shape[1] - 1),
-                ]
-                self.ax_line.plot(vals)
+                h, w = slice_data.shape
+                # One sample per pixel of line length (capped at the 200-
+                # element buffers): short lines no longer gather the same
+                # pixel repeatedly only to plot a stair-stepped duplicate.
+                n = max(2, min(200, int(np.hypot(y2 - y1, x2 - x1)) + 1))
+                yy, xx = np.linspace(y1, y2, n), np.linspace(x1, x2, n)
+                # Round (not truncate) and clip in place, then gather through
+                # a flat take(); avoids the 2D fancy-index temporaries on
+                # this interactive path.
+                np.clip(np.rint(yy, out=yy), 0, h - 1, out=yy)
+                np.clip(np.rint(xx, out=xx), 0, w - 1, out=xx)
+                iy, ix = self._profile_iy[:n], self._profile_ix[:n]
+                iy[:] = yy
+                ix[:] = xx
+                iy *= w
+                iy += ix
+                vals = slice_data.take(iy)
+                self._profile_curve.set_data(np.arange(vals.size), vals)
                 self.ax_line.set_title("Line profile (user)")
             else:
                 y_center = slice_data.shape[0] // 2
                 profile = slice_data[y_center, :]
-                self.ax_line.plot(profile)
+                self._profile_curve.set_data(np.arange(profile.size), profile)
                 self.ax_line.set_title("Line profile (center row)")
-            self.ax_line.set_xlabel("X")
-            self.ax_line.set_ylabel("Intensity")
+            self.ax_line.relim()
+            self.ax_line.autoscale_view()
             self.ax_line.axis("on")
         else:
             if self.ax_line is not None:
                 self.ax_line.clear()
+                self._profile_curve = None
                 self.ax_line.axis("off")
         if self.profile_canvas is not None:
             self.profile_canvas.draw_idle()
 
-        hist_visible = self.dock_hist is None or self.dock_hist.isVisible()
-        if (
-            self.hist_enabled
-            and self.hist_chk.isChecked()
-            and hist_visible
-            and self.ax_hist is not None
-        ):
+        if self._hist_live:
             if self._playback_mode and (time.monotonic() - self._hist_last_time) < 0.5:
                 return
             self._hist_last_time = time.monotonic()
@@ -726,38 +1124,47 @@ class RenderingMixin:
             if vals is None:
                 return
             bins = self.hist_bins_spin.value()
-            self.ax_hist.clear()
-            counts, edges = np.histogram(vals, bins=bins)
-            centers = 0.5 * (edges[:-1] + edges[1:])
-            self.ax_hist.plot(centers, counts, color="#5555aa")
-            self.ax_hist.axvline(vmin, color="#ff8800", linestyle="--", linewidth=1)
-            self.ax_hist.axvline(vmax, color="#ff8800", linestyle="--", linewidth=1)
-            self.ax_hist.set_title("Intensity histogram")
-            self.ax_hist.set_xlabel("Intensity")
-            self.ax_hist.set_ylabel("Count")
+            # Content signature: during throttled playback the sampled
+            # values and mapping are often identical frame to frame, and
+            # rebinning plus a canvas repaint for the same curve is wasted
+            # work. Small samples hash cheaply; larger ones use a
+            # size/endpoint fingerprint.
+            if vals.size < 4096:
+                fingerprint = hash(vals.tobytes())
+            else:
+                fingerprint = (vals.size, float(vals[0]), float(vals[-1]))
+            sig = (fingerprint, bins, float(vmin), float(vmax))
+            if (
+                sig == self._hist_last_sig
+                and self._hist_curve is not None
+                and self._hist_curve.axes is self.ax_hist
+            ):
+                return
+            self._hist_last_sig = sig
+            self._ensure_hist_artists()
+            counts, centers = _binned_hist(vals, bins)
+            self._hist_curve.set_data(centers, counts)
+            self._hist_vmin_line.set_xdata([vmin, vmin])
+            self._hist_vmax_line.set_xdata([vmax, vmax])
+            self.ax_hist.relim()
+            self.ax_hist.autoscale_view()
             if vals.size:
-                mean = float(np.mean(vals))
-                median = float(np.median(vals))
-                std = float(np.std(vals))
-                sat_low = int(np.sum(vals < vmin))
-                sat_high = int(np.sum(vals > vmax))
-                stats = (
+                mean, median, std, sat_low, sat_high = _hist_stats(
+                    counts, centers, vmin, vmax
+                )
+                self._hist_stats_text.set_text(
                     f"Mean {mean:.3f} | Median {median:.3f} | Std {std:.3f} | "
                     f"Sat low {sat_low} | Sat high {sat_high}"
                 )
-                self.ax_hist.text(
-                    0.02,
-                    0.95,
-                    stats,
-                    transform=self.ax_hist.transAxes,
-                    va="top",
-                    fontsize=8,
-                )
+            else:
+                self._hist_stats_text.set_text("")
             self._update_bc_controls(vals, vmin, vmax)
             self.ax_hist.axis("on")
         else:
             if self.ax_hist is not None:
                 self.ax_hist.clear()
+                self._hist_curve = None
+                self._hist_last_sig = None
                 self.ax_hist.axis("off")
         if self.hist_canvas is not None:
             self.hist_canvas.draw_idle()
@@ -786,19 +1193,35 @@ class RenderingMixin:
         return self._hist_values_current(slice_data)
 
     def _hist_values_current(self, slice_data: np.ndarray) -> np.ndarray:
+        data = slice_data
         if self.hist_region == "crop" and self.crop_rect is not None:
-            data = self._apply_crop_rect(
-                slice_data, self.crop_rect, (slice_data.shape[0], slice_data.shape[1])
+            bounds = self._crop_bounds(
+                self.crop_rect, slice_data.shape[0], slice_data.shape[1]
             )
-        else:
-            data = slice_data
+            if bounds is not None:
+                y0, y1, x0, x1 = bounds
+                data = slice_data[y0:y1, x0:x1]
         if self.hist_region == "roi":
-            mask = self._roi_mask(slice_data.shape)
-            data = slice_data[mask]
-        if self._interactive and self.downsample_hist:
-            stride = max(1, self.downsample_factor)
-            data = data[::stride, ::stride]
-        return data.ravel()
+            box = self._roi_box_bounds(slice_data.shape)
+            if box is not None:
+                y0, y1, x0, x1 = box
+                data = slice_data[y0:y1, x0:x1]
+            else:
+                region = self._roi_region_indices(slice_data.shape)
+                if region is not None:
+                    (y0, y1, x0, x1), rows, cols = region
+                    data = slice_data[y0:y1, x0:x1][rows, cols]
+        vals = data.ravel()
+        if self._interactive:
+            if self.downsample_hist:
+                stride = max(1, self.downsample_factor)
+                vals = vals[::stride]
+            # Cap the interactive sample so histogram + stats stay O(50k)
+            # while the user drags; _end_interaction re-renders at full
+            # fidelity on release.
+            if vals.size > 50_000:
+                vals = vals[:: vals.size // 50_000]
+        return vals
 
     def _request_hist_job(self, cache_key) -> None:
         if self._hist_job_id is not None:
@@ -817,42 +1240,97 @@ class RenderingMixin:
             t_count, z_count = arr.shape[0], arr.shape[1]
             t_step = max(1, t_count // 16)
             z_step = max(1, z_count // 8)
-            samples = []
-            roi_mask = None
-            roi_mask_shape = None
-            for t in range(0, t_count, t_step):
-                for z in range(0, z_count, z_step):
+            if t_count == 0 or z_count == 0:
+                return None
+            t_indices = range(0, t_count, t_step)
+            z_indices = range(0, z_count, z_step)
+            # All sampled frames share one shape, so the per-frame element
+            # count is known up front: gather each frame straight into its
+            # slot of one preallocated buffer instead of appending ~128
+            # fresh arrays and concatenating them at the end.
+            probe = arr[t_indices[0], z_indices[0], :, :]
+            # The crop rect is constant for the whole job, so resolve it to
+            # integer slice bounds once instead of re-running the rect
+            # arithmetic for each of the ~128 sampled frames.
+            crop_bounds = None
+            if region == "crop" and crop_rect is not None:
+                crop_bounds = self._crop_bounds(
+                    crop_rect, probe.shape[0], probe.shape[1]
+                )
+            if crop_bounds is not None:
+                cy0, cy1, cx0, cx1 = crop_bounds
+                probe = probe[cy0:cy1, cx0:cx1]
+            flat_idx = None
+            if region == "roi":
+                # Open-coded rather than _roi_mask: the mixin's LRU caches
+                # are main-thread only, and this runs once per job.
+                h, w = probe.shape
+                y, x = np.ogrid[:h, :w]
+                rx, ry, rw, rh = roi_rect
+                if roi_shape == "circle":
+                    cx, cy = rx + rw / 2, ry + rh / 2
+                    r = min(rw, rh) / 2
+                    roi_mask = (x - cx) ** 2 + (y - cy) ** 2 <= r**2
+                else:
+                    roi_mask = (rx <= x) & (x <= rx + rw) & (ry <= y) & (y <= ry + rh)
+                flat_idx = np.flatnonzero(roi_mask)
+                per_frame = int(flat_idx.size)
+            else:
+                per_frame = int(probe.size)
+            if per_frame == 0:
+                return None
+            # Reservoir sampling (vectorized Algorithm R) caps peak memory
+            # at the 200k-element reservoir instead of materializing the
+            # full multi-frame sample and running a sort-based rng.choice.
+            # Deterministic seed for reproducibility (P3.2).
+            cap = 200000
+            rng = np.random.default_rng(42)
+            reservoir = np.empty(cap, dtype=arr.dtype)
+            seen = 0
+
+            def _gather(pair):
+                t, z = pair
+                if crop_bounds is not None:
+                    frame = arr[t, z, cy0:cy1, cx0:cx1]
+                else:
+                    frame = arr[t, z, :, :]
+                if flat_idx is not None:
+                    return np.take(frame.ravel(), flat_idx)
+                return np.ascontiguousarray(frame).reshape(-1)
+
+            # The per-frame gathers (memmap reads + fancy indexing) are
+            # independent and release the GIL, so overlap them with a small
+            # thread pool; the reservoir merge stays sequential on the
+            # ordered results, keeping the sample deterministic. Batching
+            # bounds in-flight frame copies to a few frames.
+            pairs = [(t, z) for t in t_indices for z in z_indices]
+            workers = max(1, min(4, (os.cpu_count() or 2) // 2))
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                for start in range(0, len(pairs), workers * 2):
                     if cancel_token.is_cancelled():
                         return None
-                    frame = arr[t, z, :, :]
-                    if region == "crop" and crop_rect is not None:
-                        frame = self._apply_crop_rect(
-                            frame, crop_rect, (frame.shape[0], frame.shape[1])
-                        )
-                    if region == "roi":
-                        if roi_mask is None or roi_mask_shape != frame.shape:
-                            h, w = frame.shape
-                            y = np.arange(h)[:, None]
-                            x = np.arange(w)[None, :]
-                            rx, ry, rw, rh = roi_rect
-                            if roi_shape == "circle":
-                                cx, cy = rx + rw / 2, ry + rh / 2
-                                r = min(rw, rh) / 2
-                                roi_mask = (x - cx) ** 2 + (y - cy) ** 2 <= r**2
-                            else:
-                                roi_mask = (rx <= x) & (x <= rx + rw) & (ry <= y) & (y <= ry + rh)
-                            roi_mask_shape = frame.shape
-                        samples.append(frame[roi_mask])
-                    else:
-                        samples.append(frame.ravel())
-            if not samples:
+                    batch = pairs[start : start + workers * 2]
+                    for vals in ex.map(_gather, batch):
+                        if seen < cap:
+                            take = min(cap - seen, vals.size)
+                            reservoir[seen : seen + take] = vals[:take]
+                            seen += take
+                            vals = vals[take:]
+                        if vals.size:
+                            # Batched replacement: element i of this chunk
+                            # is stream position seen + i, kept with
+                            # probability cap / (seen + i + 1) at a random
+                            # slot.
+                            j = rng.integers(0, seen + 1 + np.arange(vals.size))
+                            accept = j < cap
+                            reservoir[j[accept]] = vals[accept]
+                            seen += vals.size
+            if seen == 0:
                 return None
-            sample = np.concatenate(samples)
-            if sample.size > 200000:
-                # Deterministic sampling for reproducibility (P3.2)
-                rng = np.random.default_rng(42)
-                idx = rng.choice(sample.size, size=200000, replace=False)
-                sample = sample[idx]
+            # A full reservoir is handed over as-is; the copy is only
+            # needed for short streams, where the slice would otherwise
+            # pin the whole cap-sized buffer.
+            sample = reservoir if seen >= cap else reservoir[:seen].copy()
             return sample, job_gen, cache_key
 
         def _on_result(result) -> None:
@@ -875,17 +1353,13 @@ class RenderingMixin:
         )
         self._hist_job_id = handle.job_id
 
-    def _norm_cached(self, panel: str, mapping: DisplayMapping):
-        key = (
-            panel,
-            float(mapping.min_val),
-            float(mapping.max_val),
-            float(mapping.gamma),
+    def _norm_cached(self, mapping: DisplayMapping):
+        # Quantize the float fields (same 1e-3 grid as the LUT caches) so a
+        # continuous slider drag reuses entries instead of churning the
+        # shared cross-panel cache with near-identical keys.
+        return build_norm_cached(
             mapping.mode,
+            round(float(mapping.min_val), 3),
+            round(float(mapping.max_val), 3),
+            round(float(mapping.gamma), 3),
         )
-        cached = self._norm_cache.get(key)
-        if cached is not None:
-            return cached
-        norm = build_norm(mapping)
-        self._norm_cache[key] = norm
-        return norm
@@ -2,36 +2,190 @@
 
 from __future__ import annotations
 
-from typing import Tuple
+from typing import Optional, Tuple
 
 import numpy as np
-from matplotlib.backends.qt_compat import QtWidgets
+from matplotlib.backends.qt_compat import QtCore, QtWidgets
 
 from phage_annotator.auto_roi import propose_roi
+from phage_annotator.fast_mask import fill_circle_region
+from phage_annotator.pyramid import downsample_mean_pool
+from phage_annotator.session_state import RoiSpec
+
+# Precomputed panel-count → (rows, cols) table; four or more panels wrap
+# into a 2x2 grid.
+_PANEL_GRID_SHAPES = {0: (1, 1), 1: (1, 1), 2: (1, 2), 3: (1, 3)}
 
 
 class RoiCropMixin:
     """Mixin for ROI and crop computations."""
 
     def _roi_mask(self, shape: Tuple[int, int]) -> np.ndarray:
+        """Boolean ROI mask for a frame of ``shape``, cached per geometry.
+
+        The mask only depends on the frame shape and ROI rect/shape, yet it
+        was rebuilt — full-image broadcast arithmetic and all — on every
+        histogram refresh. Box masks are now plain slice assignments, circle
+        masks compute only inside the ROI bounding box, and a small LRU
+        keeps the most recent geometries.
+        """
+        key = (shape, self.roi_rect, self.roi_shape)
+        cached = self._roi_mask_cache.get(key)
+        if cached is not None:
+            self._roi_mask_cache.move_to_end(key)
+            return cached
+        h, w = shape
+        rx, ry, rw, rh = self.roi_rect
+        if self.roi_shape == "none" or rw <= 0 or rh <= 0:
+            # Zero-byte all-true view; consumers only read (stride, index),
+            # so nothing needs the materialized array.
+            mask = np.broadcast_to(np.True_, (h, w))
+        elif self.roi_shape == "box":
+            mask = np.zeros((h, w), dtype=bool)
+            x0 = max(0, int(np.ceil(rx)))
+            x1 = min(w - 1, int(np.floor(rx + rw)))
+            y0 = max(0, int(np.ceil(ry)))
+            y1 = min(h - 1, int(np.floor(ry + rh)))
+            if x1 >= x0 and y1 >= y0:
+                mask[y0 : y1 + 1, x0 : x1 + 1] = True
+        else:
+            mask = np.zeros((h, w), dtype=bool)
+            cx = rx + rw / 2
+            cy = ry + rh / 2
+            r = min(rw, rh) / 2
+            x0 = max(0, int(np.floor(cx - r)))
+            x1 = min(w - 1, int(np.ceil(cx + r)))
+            y0 = max(0, int(np.floor(cy - r)))
+            y1 = min(h - 1, int(np.ceil(cy + r)))
+            if x1 >= x0 and y1 >= y0:
+                region = mask[y0 : y1 + 1, x0 : x1 + 1]
+                # Multi-megapixel circle regions are bandwidth-bound;
+                # the parallel kernel spreads the traffic across cores.
+                if region.size <= 2_000_000 or not fill_circle_region(
+                    region, y0, x0, cy, cx, r
+                ):
+                    yy = (np.arange(y0, y1 + 1, dtype=np.float32) - cy) ** 2
+                    xx = (np.arange(x0, x1 + 1, dtype=np.float32) - cx) ** 2
+                    region[...] = np.add.outer(yy, xx) <= r * r
+        # Cached masks are handed out to multiple consumers; freeze them so
+        # an accidental in-place edit cannot corrupt later hits.
+        mask.setflags(write=False)
+        # Masks for other frame sizes are dead weight once the displayed
+        # image changes; drop them so the cache only ever holds masks
+        # sized to the current image.
+        for stale in [k for k in self._roi_mask_cache if k[0] != shape]:
+            del self._roi_mask_cache[stale]
+        self._roi_mask_cache[key] = mask
+        while len(self._roi_mask_cache) > 4:
+            self._roi_mask_cache.popitem(last=False)
+        return mask
+
+    def _roi_region_indices(
+        self, shape: Tuple[int, int]
+    ) -> Optional[Tuple[Tuple[int, int, int, int], np.ndarray, np.ndarray]]:
+        """Bounding box and box-local gather indices of the ROI, cached.
+
+        Returns ``((y0, y1, x0, x1), rows, cols)`` — slice bounds of the
+        ROI bounding box plus integer row/column arrays local to it — or
+        None when the ROI covers the whole frame (the default right after
+        a reset) or selects nothing. Boolean-mask indexing re-derives the
+        gather indices from the mask on every call; caching ``nonzero``
+        once per geometry collapses the per-frame work to a single fancy
+        gather, and keeping the indices local to the bounding box confines
+        the gather's address range to the pixels the ROI can touch, so a
+        small circle in a large frame stays cache-resident instead of
+        striding the whole image.
+        """
         h, w = shape
-        y = np.arange(h)[:, None]
-        x = np.arange(w)[None, :]
         rx, ry, rw, rh = self.roi_rect
         if self.roi_shape == "none" or rw <= 0 or rh <= 0:
-            return np.ones((h, w), dtype=bool)
-        if self.roi_shape == "box":
-            return (x >= rx) & (x <= rx + rw) & (y >= ry) & (y <= ry + rh)
-        cx = rx + rw / 2
-        cy = ry + rh / 2
-        r = min(rw, rh) / 2
-        return (x - cx) ** 2 + (y - cy) ** 2 <= r**2
+            return None
+        if (
+            self.roi_shape == "box"
+            and rx <= 0
+            and ry <= 0
+            and rx + rw >= w
+            and ry + rh >= h
+        ):
+            return None
+        key = (shape, self.roi_rect, self.roi_shape)
+        cached = self._roi_idx_cache.get(key)
+        if cached is not None:
+            self._roi_idx_cache.move_to_end(key)
+            return cached
+        mask = self._roi_mask(shape)
+        rows_full, cols_full = np.nonzero(mask)
+        if rows_full.size == 0:
+            return None
+        # nonzero returns row-major order, so the row extent is free; the
+        # column extent needs a reduction.
+        y0 = int(rows_full[0])
+        y1 = int(rows_full[-1]) + 1
+        x0 = int(cols_full.min())
+        x1 = int(cols_full.max()) + 1
+        # int32 indices halve the gather's index traffic; box-local values
+        # are bounded by the frame dimensions, which always fit.
+        rows = (rows_full - y0).astype(np.int32, copy=False)
+        cols = (cols_full - x0).astype(np.int32, copy=False)
+        rows.setflags(write=False)
+        cols.setflags(write=False)
+        region = ((y0, y1, x0, x1), rows, cols)
+        for stale in [k for k in self._roi_idx_cache if k[0] != shape]:
+            del self._roi_idx_cache[stale]
+        self._roi_idx_cache[key] = region
+        while len(self._roi_idx_cache) > 4:
+            self._roi_idx_cache.popitem(last=False)
+        return region
+
+    def _release_roi_caches(self) -> None:
+        """Drop cached ROI masks/indices when the ROI is cleared or reset.
+
+        The LRUs stay correct without this (keys include the geometry), but
+        full-frame masks are megabytes each and worthless once the ROI is
+        gone.
+        """
+        self._roi_mask_cache.clear()
+        self._roi_idx_cache.clear()
+
+    def _roi_box_bounds(self, shape: Tuple[int, int]) -> Optional[Tuple[int, int, int, int]]:
+        """Slice bounds ``(y0, y1, x0, x1)`` for a box ROI, or None.
+
+        Uses the same ceil/floor pixel coverage as ``_roi_mask`` so the
+        sliced rectangle selects exactly the pixels the mask would; None
+        means the ROI is not a usable box and callers should fall back to
+        the mask/index path.
+        """
+        if self.roi_shape != "box":
+            return None
+        h, w = shape
+        rx, ry, rw, rh = self.roi_rect
+        if rw <= 0 or rh <= 0:
+            return None
+        x0 = max(0, int(np.ceil(rx)))
+        x1 = min(w - 1, int(np.floor(rx + rw)))
+        y0 = max(0, int(np.ceil(ry)))
+        y1 = min(h - 1, int(np.floor(ry + rh)))
+        if x1 < x0 or y1 < y0:
+            return None
+        return y0, y1 + 1, x0, x1 + 1
 
     def _roi_values(self, slice_data: np.ndarray) -> np.ndarray:
-        mask = self._roi_mask(slice_data.shape)
-        if not mask.any():
-            return slice_data.flatten()
-        return slice_data[mask]
+        _, _, rw, rh = self.roi_rect
+        if self.roi_shape == "none" or rw <= 0 or rh <= 0:
+            # "No ROI" is implied by the rect/shape scalars alone; answer
+            # it here without touching the mask/index helpers.
+            return slice_data.ravel()
+        box = self._roi_box_bounds(slice_data.shape)
+        if box is not None:
+            # A box ROI is a contiguous rectangle: slice it instead of
+            # gathering every pixel through an index array.
+            y0, y1, x0, x1 = box
+            return slice_data[y0:y1, x0:x1].ravel()
+        region = self._roi_region_indices(slice_data.shape)
+        if region is None:
+            return slice_data.ravel()
+        (y0, y1, x0, x1), rows, cols = region
+        return slice_data[y0:y1, x0:x1][rows, cols]
 
     def _clear_roi(self) -> None:
         """Clear the active ROI selection (P3.3: confirmation added)."""
@@ -47,6 +201,7 @@ class RoiCropMixin:
             if reply != QtWidgets.QMessageBox.StandardButton.Yes:
                 return
         self.controller.clear_roi()
+        self._release_roi_caches()
         self._sync_roi_controls()
         self._refresh_image()
 
@@ -80,32 +235,50 @@ class RoiCropMixin:
 
     def _reset_roi(self) -> None:
         """Reset ROI to the full image bounds."""
-        img = self.primary_image
-        if img.array is not None:
-            h, w = img.array.shape[2], img.array.shape[3]
-        else:
-            h, w = img.shape[-2], img.shape[-1]
+        h, w = self._image_hw()
         rect = (0.0, 0.0, float(w), float(h))
         self.controller.set_roi(rect, shape="circle")
         self.roi_rect = rect
         self.roi_shape = "circle"
+        self._release_roi_caches()
         self._sync_roi_controls()
         self._refresh_image()
 
     def _sync_roi_controls(self) -> None:
-        rect = self.roi_rect
-        self.roi_x_spin.blockSignals(True)
-        self.roi_y_spin.blockSignals(True)
-        self.roi_w_spin.blockSignals(True)
-        self.roi_h_spin.blockSignals(True)
-        self.roi_x_spin.setValue(rect[0])
-        self.roi_y_spin.setValue(rect[1])
-        self.roi_w_spin.setValue(rect[2])
-        self.roi_h_spin.setValue(rect[3])
-        self.roi_x_spin.blockSignals(False)
-        self.roi_y_spin.blockSignals(False)
-        self.roi_w_spin.blockSignals(False)
-        self.roi_h_spin.blockSignals(False)
+        self._batch_set_spins(
+            (self.roi_x_spin, self.roi_y_spin, self.roi_w_spin, self.roi_h_spin),
+            self.roi_rect,
+        )
+
+    @staticmethod
+    def _batch_set_spins(spins, values) -> None:
+        """Write several spin boxes without emitting per-widget signals.
+
+        Replaces the repeated blockSignals(True)/setValue/blockSignals(False)
+        ladders; QSignalBlocker restores the previous blocked state even if
+        a setValue raises.
+        """
+        blockers = [QtCore.QSignalBlocker(spin) for spin in spins]
+        try:
+            for spin, value in zip(spins, values):
+                spin.setValue(value)
+        finally:
+            del blockers
+
+    @staticmethod
+    def _clamp_rect_to_bounds(
+        x: float, y: float, w: float, h: float, img_w: int, img_h: int
+    ) -> Tuple[float, float, float, float]:
+        """Clamp a rect to image bounds.
+
+        Scalar min/max on four values beats a 4-vector np.clip here:
+        array construction and ufunc dispatch dominate at this size.
+        """
+        x_clamped = max(0.0, min(x, img_w - 1))
+        y_clamped = max(0.0, min(y, img_h - 1))
+        w_clamped = max(1.0, min(w, img_w - x_clamped))
+        h_clamped = max(1.0, min(h, img_h - y_clamped))
+        return x_clamped, y_clamped, w_clamped, h_clamped
 
     def _on_roi_change(self) -> None:
         """Handle ROI spinbox changes with validation and clamping to image bounds."""
@@ -114,45 +287,32 @@ class RoiCropMixin:
         y = float(self.roi_y_spin.value())
         w = float(self.roi_w_spin.value())
         h = float(self.roi_h_spin.value())
-        
+
         # Get image bounds
-        img = self.primary_image
-        if img.array is not None:
-            img_h, img_w = img.array.shape[2], img.array.shape[3]
-        else:
-            img_h, img_w = img.shape[-2], img.shape[-1]
-        
-        # Clamp to image bounds
-        x_clamped = max(0.0, min(x, img_w - 1))
-        y_clamped = max(0.0, min(y, img_h - 1))
-        w_clamped = max(1.0, min(w, img_w - x_clamped))
-        h_clamped = max(1.0, min(h, img_h - y_clamped))
-        
+        img_h, img_w = self._image_hw()
+
+        x_clamped, y_clamped, w_clamped, h_clamped = self._clamp_rect_to_bounds(
+            x, y, w, h, img_w, img_h
+        )
+
         # Update spinboxes if values were clamped
         if x_clamped != x or y_clamped != y or w_clamped != w or h_clamped != h:
-            self.roi_x_spin.blockSignals(True)
-            self.roi_y_spin.blockSignals(True)
-            self.roi_w_spin.blockSignals(True)
-            self.roi_h_spin.blockSignals(True)
-            
-            self.roi_x_spin.setValue(x_clamped)
-            self.roi_y_spin.setValue(y_clamped)
-            self.roi_w_spin.setValue(w_clamped)
-            self.roi_h_spin.setValue(h_clamped)
-            
-            self.roi_x_spin.blockSignals(False)
-            self.roi_y_spin.blockSignals(False)
-            self.roi_w_spin.blockSignals(False)
-            self.roi_h_spin.blockSignals(False)
-            
+            self._batch_set_spins(
+                (self.roi_x_spin, self.roi_y_spin, self.roi_w_spin, self.roi_h_spin),
+                (x_clamped, y_clamped, w_clamped, h_clamped),
+            )
             # Show feedback to user
             self._set_status("ROI clamped to image bounds")
         
         rect = (x_clamped, y_clamped, w_clamped, h_clamped)
+        if rect == self.roi_rect:
+            # Programmatic syncs and focus-out events replay the current
+            # value; nothing to apply, record, or redraw.
+            return
         self.controller.set_roi(rect, shape=self.roi_shape)
         self.roi_rect = rect
         self.recorder.record("roi_change", {"rect": self.roi_rect, "shape": self.roi_shape})
-        self._refresh_image()
+        self._roi_refresh_timer.start()
 
     def _on_roi_shape_change(self) -> None:
         btns = self.roi_shape_group.buttons()
@@ -162,10 +322,12 @@ class RoiCropMixin:
             shape = "box"
         else:
             shape = "circle"
+        if shape == self.roi_shape:
+            return
         self.controller.set_roi(self.roi_rect, shape=shape)
         self.roi_shape = shape
         self.recorder.record("roi_shape", {"shape": shape})
-        self._refresh_image()
+        self._roi_refresh_timer.start()
 
     def _auto_roi_mode_changed(self, text: str) -> None:
         if not hasattr(self, "auto_roi_wh_widget"):
@@ -236,21 +398,38 @@ class RoiCropMixin:
         def _job(progress, cancel_token):
             if cancel_token.is_cancelled():
                 return None
+            # ROI selection does not need full-resolution scoring: on large
+            # slices run propose_roi on a 2x mean-pooled level and scale
+            # the geometric result back up, quartering the bandwidth of
+            # every scoring pass for a placement error of at most a pixel
+            # or two on a >=100 px ROI.
+            data = slice_data
+            factor = 1
+            if data.size > 4_000_000:
+                factor = 2
+                data = downsample_mean_pool(data, factor)
             spec, diag = propose_roi(
-                slice_data,
+                data,
                 shape=shape,
-                request_w=req_w,
-                request_h=req_h,
-                request_area=req_area,
-                min_side=100,
-                max_circle_radius=300,
+                request_w=None if req_w is None else max(1, req_w // factor),
+                request_h=None if req_h is None else max(1, req_h // factor),
+                request_area=None
+                if req_area is None
+                else max(1, req_area // (factor * factor)),
+                min_side=100 // factor,
+                max_circle_radius=300 // factor,
                 max_area=None,
                 stride=None,
-                bg_sigma=30.0,
+                bg_sigma=30.0 / factor,
                 p_low=1.0,
                 p_high=99.5,
                 weights=None,
             )
+            if factor > 1:
+                spec = RoiSpec(
+                    rect=tuple(float(v * factor) for v in spec.rect),
+                    shape=spec.shape,
+                )
             if cancel_token.is_cancelled():
                 return None
             return spec, diag, job_gen
@@ -296,11 +475,7 @@ class RoiCropMixin:
 
     def _reset_crop(self, initial: bool = False) -> None:
         """Reset crop to full frame bounds."""
-        img = self.primary_image
-        if img.array is not None:
-            h, w = img.array.shape[2], img.array.shape[3]
-        else:
-            h, w = img.shape[-2], img.shape[-1]
+        h, w = self._image_hw()
         if initial:
             self.crop_rect = (0.0, 0.0, float(w), float(h))
         else:
@@ -318,68 +493,45 @@ class RoiCropMixin:
         
         # Handle zero/negative dimensions
         if w <= 0 or h <= 0:
+            if self.crop_rect is None:
+                return
             self.crop_rect = None
-            self._refresh_image()
+            self._roi_refresh_timer.start()
             return
         
         # Get image bounds
-        img = self.primary_image
-        if img.array is not None:
-            img_h, img_w = img.array.shape[2], img.array.shape[3]
-        else:
-            img_h, img_w = img.shape[-2], img.shape[-1]
-        
-        # Clamp to image bounds
-        x_clamped = max(0.0, min(x, img_w - 1))
-        y_clamped = max(0.0, min(y, img_h - 1))
-        w_clamped = max(1.0, min(w, img_w - x_clamped))
-        h_clamped = max(1.0, min(h, img_h - y_clamped))
+        img_h, img_w = self._image_hw()
         
+        x_clamped, y_clamped, w_clamped, h_clamped = self._clamp_rect_to_bounds(
+            x, y, w, h, img_w, img_h
+        )
+
         # Update spinboxes if values were clamped
         if x_clamped != x or y_clamped != y or w_clamped != w or h_clamped != h:
-            self.crop_x_spin.blockSignals(True)
-            self.crop_y_spin.blockSignals(True)
-            self.crop_w_spin.blockSignals(True)
-            self.crop_h_spin.blockSignals(True)
-            
-            self.crop_x_spin.setValue(x_clamped)
-            self.crop_y_spin.setValue(y_clamped)
-            self.crop_w_spin.setValue(w_clamped)
-            self.crop_h_spin.setValue(h_clamped)
-            
-            self.crop_x_spin.blockSignals(False)
-            self.crop_y_spin.blockSignals(False)
-            self.crop_w_spin.blockSignals(False)
-            self.crop_h_spin.blockSignals(False)
-            
+            self._batch_set_spins(
+                (self.crop_x_spin, self.crop_y_spin, self.crop_w_spin, self.crop_h_spin),
+                (x_clamped, y_clamped, w_clamped, h_clamped),
+            )
             # Show feedback to user
             self._set_status("Crop clamped to image bounds")
         
-        self.crop_rect = (x_clamped, y_clamped, w_clamped, h_clamped)
-        self._refresh_image()
+        rect = (x_clamped, y_clamped, w_clamped, h_clamped)
+        if rect == self.crop_rect:
+            return
+        self.crop_rect = rect
+        self._roi_refresh_timer.start()
 
     def _sync_crop_controls(self) -> None:
-        if self.crop_rect is None:
-            rect = (0.0, 0.0, 0.0, 0.0)
-        else:
-            rect = self.crop_rect
-        self.crop_x_spin.blockSignals(True)
-        self.crop_y_spin.blockSignals(True)
-        self.crop_w_spin.blockSignals(True)
-        self.crop_h_spin.blockSignals(True)
-        self.crop_x_spin.setValue(rect[0])
-        self.crop_y_spin.setValue(rect[1])
-        self.crop_w_spin.setValue(rect[2])
-        self.crop_h_spin.setValue(rect[3])
-        self.crop_x_spin.blockSignals(False)
-        self.crop_y_spin.blockSignals(False)
-        self.crop_w_spin.blockSignals(False)
-        self.crop_h_spin.blockSignals(False)
+        rect = self.crop_rect if self.crop_rect is not None else (0.0, 0.0, 0.0, 0.0)
+        self._batch_set_spins(
+            (self.crop_x_spin, self.crop_y_spin, self.crop_w_spin, self.crop_h_spin),
+            rect,
+        )
 
     def _apply_crop(self, data: np.ndarray) -> np.ndarray:
         if self.crop_rect is None:
             return data
-        return self._apply_crop_rect(data, self.crop_rect, (data.shape[0], data.shape[1]))
+        return self._apply_crop_rect(data, self.crop_rect)
 
     def _on_panel_toggle(self, key: str, checked: bool) -> None:
         if not checked and sum(self._panel_visibility.values()) <= 1:
@@ -391,13 +543,7 @@ class RoiCropMixin:
         self._refresh_image()
 
     def _panel_grid_shape(self, n: int) -> Tuple[int, int]:
-        if n <= 1:
-            return 1, 1
-        if n == 2:
-            return 1, 2
-        if n == 3:
-            return 1, 3
-        return 2, 2
+        return _PANEL_GRID_SHAPES.get(n, (2, 2))
 
     def _rebuild_figure_layout(self) -> None:
         layout_spec = {
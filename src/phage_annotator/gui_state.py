@@ -87,6 +87,7 @@ class StateMixin:
     @current_image_idx.setter
     def current_image_idx(self, value: int) -> None:
         self.controller.set_primary(value)
+        self._invalidate_playback_bounds()
 
     @property
     def support_image_idx(self) -> int:
@@ -304,12 +305,28 @@ class StateMixin:
     def support_image(self) -> "LazyImage":
         return self.images[self.support_image_idx]
 
+    def _image_hw(self) -> Tuple[int, int]:
+        """Full-resolution (height, width) of the primary image.
+
+        Loaded stacks are (T, Z, Y, X); unloaded ones only expose the
+        recorded shape. Centralizes the probe the ROI/crop handlers all
+        open-coded.
+        """
+        img = self.primary_image
+        if img.array is not None:
+            return img.array.shape[2], img.array.shape[3]
+        return img.shape[-2], img.shape[-1]
+
     def _ensure_loaded(self, idx: int) -> None:
         """Load a stack lazily into memory and evict non-active images."""
         img = self.images[idx]
         if img.array is None:
             arr, has_time, has_z = load_array(
-                img.path, interpret_3d_as=img.interpret_3d_as, ome_axes=img.ome_axes
+                img.path,
+                interpret_3d_as=img.interpret_3d_as,
+                ome_axes=img.ome_axes,
+                has_time=img.has_time,
+                has_z=img.has_z,
             )
             img.array = arr
             img.has_time = has_time
@@ -426,23 +443,56 @@ class StateMixin:
             return (0.0, 0.0, 0.0, 0.0)
         return crop_rect
 
+    def _crop_bounds(
+        self,
+        crop_rect: Tuple[float, float, float, float],
+        full_h: int,
+        full_w: int,
+    ) -> Optional[Tuple[int, int, int, int]]:
+        """Resolve a crop rect (X, Y, W, H) to integer slice bounds.
+
+        Returns ``(y0, y1, x0, x1)``, or None when the rect is degenerate
+        or covers the whole frame. Callers slicing many frames of the same
+        shape can resolve the bounds once and index directly instead of
+        re-running the rect arithmetic per frame. A one-slot memo covers
+        the dominant case — the same rect against the same frame shape on
+        every refresh — so repeated calls skip the arithmetic entirely.
+        """
+        key = (crop_rect, full_h, full_w)
+        memo = self._crop_bounds_memo
+        if memo is not None and memo[0] == key:
+            return memo[1]
+        x, y, w, h = crop_rect
+        if w <= 0 or h <= 0:
+            bounds = None
+        elif x <= 0 and y <= 0 and w >= full_w and h >= full_h:
+            bounds = None
+        else:
+            x0 = int(max(0, x))
+            y0 = int(max(0, y))
+            x1 = int(min(full_w, x + w))
+            y1 = int(min(full_h, y + h))
+            bounds = (y0, y1, x0, x1)
+        self._crop_bounds_memo = (key, bounds)
+        return bounds
+
     def _apply_crop_rect(
         self,
         data: np.ndarray,
         crop_rect: Tuple[float, float, float, float],
-        full_shape: Tuple[int, int],
+        full_shape: Optional[Tuple[int, int]] = None,
     ) -> np.ndarray:
-        """Apply a crop rect (X, Y, W, H) to a 2D array."""
-        x, y, w, h = crop_rect
-        full_h, full_w = full_shape
-        if w <= 0 or h <= 0:
-            return data
-        if x <= 0 and y <= 0 and w >= full_w and h >= full_h:
+        """Apply a crop rect (X, Y, W, H) to a 2D array.
+
+        Axis-aligned crops return a zero-copy view; ``full_shape`` defaults
+        to the array's own shape and only needs passing when the rect is
+        expressed against a different resolution.
+        """
+        full_h, full_w = full_shape if full_shape is not None else data.shape[:2]
+        bounds = self._crop_bounds(crop_rect, full_h, full_w)
+        if bounds is None:
             return data
-        x0 = int(max(0, x))
-        y0 = int(max(0, y))
-        x1 = int(min(full_w, x + w))
-        y1 = int(min(full_h, y + h))
+        y0, y1, x0, x1 = bounds
         return data[y0:y1, x0:x1]
 
     def _downsample(self, data: np.ndarray, factor: int) -> np.ndarray:
@@ -631,9 +681,9 @@ class StateMixin:
         if arr.nbytes >= PROJECTION_ASYNC_BYTES:
             handle = self.jobs.submit(_job, name=job_name, on_result=_on_result, on_error=_on_error)
             job_id_holder["id"] = handle.job_id
-            self._projection_jobs[key_mean] = handle.job_id
-            self._projection_jobs[key_std] = handle.job_id
-            self._projection_jobs[key_comp] = handle.job_id
+            self._register_projection_job(key_mean, handle.job_id)
+            self._register_projection_job(key_std, handle.job_id)
+            self._register_projection_job(key_comp, handle.job_id)
         else:
             try:
                 result = _job(lambda _v, _m="": None, CancelTokenShim())
@@ -674,24 +724,26 @@ class StateMixin:
                 artist.remove()
 
     def _read_playback_block(self, t_start: int, t_stop: int, z_idx: int) -> np.ndarray:
-        """Read a contiguous block of frames for playback prefetching."""
+        """Read a contiguous block of frames for playback prefetching.
+
+        Frames are mapped to RGBA uint8 here, on the prefetcher thread, so
+        the GUI render path skips the float colormap pipeline entirely.
+        """
         prim = self.primary_image
         if prim.array is None:
             return np.empty((0, 0, 0), dtype=np.float32)
         block = read_contiguous_block(prim.array, t_start, t_stop, z_idx)
-        if self.crop_rect is None:
-            return block
-        x, y, w, h = self.crop_rect
-        if w <= 0 or h <= 0:
-            return block
-        full_h, full_w = block.shape[1], block.shape[2]
-        if x <= 0 and y <= 0 and w >= full_w and h >= full_h:
-            return block
-        x0 = int(max(0, x))
-        y0 = int(max(0, y))
-        x1 = int(min(full_w, x + w))
-        y1 = int(min(full_h, y + h))
-        return block[:, y0:y1, x0:x1]
+        if self.crop_rect is not None:
+            x, y, w, h = self.crop_rect
+            if w > 0 and h > 0:
+                full_h, full_w = block.shape[1], block.shape[2]
+                if not (x <= 0 and y <= 0 and w >= full_w and h >= full_h):
+                    x0 = int(max(0, x))
+                    y0 = int(max(0, y))
+                    x1 = int(min(full_w, x + w))
+                    y1 = int(min(full_h, y + h))
+                    block = block[:, y0:y1, x0:x1]
+        return self._apply_playback_lut(block)
 
     def _update_buffer_stats(self) -> None:
         """Update playback buffer stats in the status bar."""
@@ -912,6 +912,9 @@ class UiSetupMixin:
             spin.setRange(0.0, 1_000_000.0)
             spin.setDecimals(2)
             spin.setSingleStep(1.0)
+            # Emit only committed values while typing; arrow/drag bursts
+            # are coalesced by the refresh debounce timer.
+            spin.setKeyboardTracking(False)
         rx, ry, rw, rh = self.roi_rect
         self.roi_x_spin.setValue(rx)
         self.roi_y_spin.setValue(ry)
@@ -944,6 +947,7 @@ class UiSetupMixin:
             spin.setRange(0.0, 1_000_000.0)
             spin.setDecimals(2)
             spin.setSingleStep(1.0)
+            spin.setKeyboardTracking(False)
         if self.crop_rect:
             cx, cy, cw, ch = self.crop_rect
         else:
@@ -13,7 +13,9 @@ Conventions
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, List, Optional, Tuple
 
@@ -28,6 +30,7 @@ __all__ = [
     "ImageMeta",
     "load_images",
     "standardize_axes",
+    "standardize_axes_fast",
     "read_contiguous_block",
     "read_contiguous_block_from_path",
     "read_metadata_bundle",
@@ -126,6 +129,28 @@ def standardize_axes(
     return arr, has_time, has_z
 
 
+def standardize_axes_fast(
+    arr: np.ndarray, has_time: bool, has_z: bool
+) -> tuple[np.ndarray, bool, bool]:
+    """Standardize to (T, Z, Y, X) using pre-derived time/Z flags.
+
+    Fast path for arrays whose axis presence was already inferred during
+    metadata reading; skips OME parsing and the 3D heuristic. Falls back to
+    :func:`standardize_axes` when the flags do not match the array rank.
+    """
+    ndim = arr.ndim
+    if ndim == 2:
+        return arr[np.newaxis, np.newaxis, :, :], False, False
+    if ndim == 3:
+        if has_time and not has_z:
+            return arr[:, np.newaxis, :, :], True, False
+        if has_z and not has_time:
+            return arr[np.newaxis, :, :, :], False, True
+    elif ndim == 4:
+        return arr, True, True
+    return standardize_axes(arr)
+
+
 def load_images(paths: Iterable[Path]) -> List[ImageMeta]:
     """Load TIFF/OME-TIFF stacks, standardize axes, and wrap in ImageMeta.
 
@@ -157,13 +182,37 @@ def load_images(paths: Iterable[Path]) -> List[ImageMeta]:
     return metas
 
 
+def _advise_block_willneed(arr: np.ndarray, t_start: int, t_stop: int) -> None:
+    """Hint the OS to read ahead the bytes backing frames ``[t_start, t_stop)``.
+
+    Best-effort: a no-op for in-memory arrays and on platforms without
+    ``posix_fadvise``.
+    """
+    base = arr
+    while not isinstance(base, np.memmap) and getattr(base, "base", None) is not None:
+        base = base.base
+    if not isinstance(base, np.memmap) or not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        frame_bytes = int(np.prod(arr.shape[1:])) * arr.dtype.itemsize
+        offset = int(getattr(base, "offset", 0)) + t_start * frame_bytes
+        length = max(0, t_stop - t_start) * frame_bytes
+        with open(base.filename, "rb") as fh:
+            os.posix_fadvise(fh.fileno(), offset, length, os.POSIX_FADV_WILLNEED)
+    except (OSError, ValueError, TypeError):
+        pass
+
+
 def read_contiguous_block(arr: np.ndarray, t_start: int, t_stop: int, z_idx: int) -> np.ndarray:
     """Return a contiguous block (T slice) from a standardized (T, Z, Y, X) array.
 
     Contiguous slicing helps the OS perform sequential reads for memmap-backed
-    arrays, reducing disk seek overhead during playback.
+    arrays, reducing disk seek overhead during playback. The block is
+    materialized here (with a read-ahead hint) so memmap page faults land on
+    the prefetcher thread instead of the GUI thread.
     """
-    return arr[t_start:t_stop, z_idx, :, :]
+    _advise_block_willneed(arr, t_start, t_stop)
+    return np.ascontiguousarray(arr[t_start:t_stop, z_idx, :, :])
 
 
 def read_contiguous_block_from_path(
@@ -200,5 +249,15 @@ def read_metadata_bundle(path: Path) -> MetadataBundle:
 
 
 def read_metadata_summary(path: Path) -> dict:
-    """Read a lightweight metadata summary without pixel data."""
-    return _read_summary(str(path))
+    """Read a lightweight metadata summary without pixel data.
+
+    Cached by ``(path, mtime, size)``; unchanged files are parsed once.
+    """
+    st = Path(path).stat()
+    return dict(_read_summary_cached(str(path), st.st_mtime_ns, st.st_size))
+
+
+@lru_cache(maxsize=4096)
+def _read_summary_cached(path_str: str, mtime_ns: int, size: int) -> dict:
+    del mtime_ns, size  # cache-key components only
+    return _read_summary(path_str)
@@ -26,20 +26,22 @@ class CancelToken:
 
     Notes
     -----
-    Cancellation is cooperative: workers must check ``is_cancelled()``.
+    Cancellation is cooperative: workers must check ``is_cancelled()`` or
+    sleep through ``wait()``, which wakes immediately on cancel.
     """
 
     def __init__(self) -> None:
-        self._lock = threading.Lock()
-        self._cancelled = False
+        self._event = threading.Event()
 
     def cancel(self) -> None:
-        with self._lock:
-            self._cancelled = True
+        self._event.set()
 
     def is_cancelled(self) -> bool:
-        with self._lock:
-            return self._cancelled
+        return self._event.is_set()
+
+    def wait(self, timeout: float) -> bool:
+        """Block for up to ``timeout`` seconds; return True when cancelled."""
+        return self._event.wait(timeout)
 
 
 class JobSignals(QtCore.QObject):
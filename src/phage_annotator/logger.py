@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
 _LOGGER_NAME = "phage_annotator"
 
+_listener: Optional[QueueListener] = None
+
 
 class _JobIdFilter(logging.Filter):
     def filter(self, record: logging.LogRecord) -> bool:
@@ -18,11 +23,16 @@ class _JobIdFilter(logging.Filter):
 def get_logger(name: str) -> logging.Logger:
     """Return a logger configured for console output.
 
+    Records are routed through a queue and drained by a background listener
+    thread, so callers (including the GUI thread during job-signal floods)
+    never block on the actual sink.
+
     Parameters
     ----------
     name : str
         Module name, typically ``__name__``.
     """
+    global _listener
     base = logging.getLogger(_LOGGER_NAME)
     if not base.handlers:
         base.setLevel(logging.INFO)
@@ -34,7 +44,13 @@ def get_logger(name: str) -> logging.Logger:
         )
         handler.setFormatter(formatter)
         handler.addFilter(_JobIdFilter())
-        base.addHandler(handler)
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.addFilter(_JobIdFilter())
+        base.addHandler(queue_handler)
+        _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_listener.stop)
         base.propagate = False
     logger = logging.getLogger(f"{_LOGGER_NAME}.{name}")
     logger.setLevel(base.level)
@@ -47,12 +63,19 @@ def set_level(level: int) -> None:
     base.setLevel(level)
     for handler in base.handlers:
         handler.setLevel(level)
+    if _listener is not None:
+        for handler in _listener.handlers:
+            handler.setLevel(level)
 
 
 def attach_gui_handler(handler: Optional[logging.Handler]) -> None:
     """Optionally attach a GUI handler (e.g., a dock log view)."""
     if handler is None:
         return
+    if _listener is not None:
+        if handler not in _listener.handlers:
+            _listener.handlers = (*_listener.handlers, handler)
+        return
     base = logging.getLogger(_LOGGER_NAME)
     if handler not in base.handlers:
         base.addHandler(handler)
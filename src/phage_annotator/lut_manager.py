@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List
 
 import matplotlib.cm as cm
@@ -36,8 +37,14 @@ def lut_names() -> List[str]:
     return [spec.name for spec in LUTS]
 
 
+@lru_cache(maxsize=2 * len(LUTS))
 def cmap_for(spec: LutSpec, invert: bool = False):
-    """Return a matplotlib colormap for the LUT spec."""
+    """Return a matplotlib colormap for the LUT spec.
+
+    Memoized per ``(spec, invert)``: ``LutSpec`` is a frozen dataclass, so
+    repeated refreshes reuse the same Colormap instead of reconstructing
+    (and re-reversing) it five times per frame.
+    """
     cmap = cm.get_cmap(spec.matplotlib_cmap_name)
     if invert and spec.invert_supported:
         return cmap.reversed()
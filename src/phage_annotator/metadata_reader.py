@@ -46,11 +46,19 @@ def read_metadata(path: str) -> MetadataBundle:
 def read_metadata_summary(path: str) -> Dict[str, Any]:
     """Read a summary metadata dict without parsing full raw tags."""
     with tif.TiffFile(path) as tf:
-        series = tf.series[0]
-        ome_parsed = _parse_ome_metadata(tf.ome_metadata) if tf.ome_metadata else None
-        micromanager = _parse_micromanager(tf, {})
-        summary = _build_summary(series, ome_parsed, micromanager)
-    return summary
+        return summary_from_tiff(tf)
+
+
+def summary_from_tiff(tf: tif.TiffFile) -> Dict[str, Any]:
+    """Build the summary dict from an already-open :class:`tifffile.TiffFile`.
+
+    Lets callers that need both the summary and series metadata pay for a
+    single file open/parse.
+    """
+    series = tf.series[0]
+    ome_parsed = _parse_ome_metadata(tf.ome_metadata) if tf.ome_metadata else None
+    micromanager = _parse_micromanager(tf, {})
+    return _build_summary(series, ome_parsed, micromanager)
 
 
 def _build_summary(
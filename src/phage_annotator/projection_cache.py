@@ -30,10 +30,11 @@ PyramidKey = Tuple[int, str, int, int, Tuple[float, float, float, float], int]
 
 @dataclass
 class CacheItem:
-    """Cached projection and its byte size."""
+    """Cached projection, its byte size, and the generation it was stored in."""
 
     data: np.ndarray
     nbytes: int
+    generation: int = 0
 
 
 @dataclass
@@ -77,6 +78,7 @@ class ProjectionCache:
         self._pyramid_items: "OrderedDict[PyramidKey, CacheItem]" = OrderedDict()
         self._max_bytes = int(max_mb) * 1024 * 1024
         self._total_bytes = 0
+        self._generation = 0
         self._telemetry = CacheTelemetry()
         self._warning_callback: Optional[callable] = None  # For toast notifications
 
@@ -91,12 +93,21 @@ class ProjectionCache:
         self._warning_callback = callback
 
     def get(self, key: CacheKey) -> Optional[np.ndarray]:
-        """Return a cached array and mark it as most-recently-used."""
+        """Return a cached array and mark it as most-recently-used.
+
+        Entries written before the last :meth:`bump_generation` are treated as
+        misses and evicted lazily on access.
+        """
         item = self._items.get(key)
         if item is None:
             self._telemetry.misses += 1
             return None
-        
+        if item.generation < self._generation:
+            self._items.pop(key, None)
+            self._total_bytes -= item.nbytes
+            self._telemetry.misses += 1
+            return None
+
         self._telemetry.hits += 1
         self._items.move_to_end(key)
         return item.data
@@ -107,7 +118,7 @@ class ProjectionCache:
         existing = self._items.pop(key, None)
         if existing is not None:
             self._total_bytes -= existing.nbytes
-        self._items[key] = CacheItem(data=data, nbytes=nbytes)
+        self._items[key] = CacheItem(data=data, nbytes=nbytes, generation=self._generation)
         self._total_bytes += nbytes
         self._evict_if_needed()
 
@@ -116,6 +127,10 @@ class ProjectionCache:
         item = self._pyramid_items.get(key)
         if item is None:
             return None
+        if item.generation < self._generation:
+            self._pyramid_items.pop(key, None)
+            self._total_bytes -= item.nbytes
+            return None
         self._pyramid_items.move_to_end(key)
         return item.data
 
@@ -125,10 +140,32 @@ class ProjectionCache:
         existing = self._pyramid_items.pop(key, None)
         if existing is not None:
             self._total_bytes -= existing.nbytes
-        self._pyramid_items[key] = CacheItem(data=data, nbytes=nbytes)
+        self._pyramid_items[key] = CacheItem(data=data, nbytes=nbytes, generation=self._generation)
         self._total_bytes += nbytes
         self._evict_if_needed()
 
+    def bump_generation(self) -> None:
+        """Invalidate all current entries without touching their memory yet.
+
+        Stale entries are dropped lazily on access or by :meth:`gc_stale`;
+        this keeps generation bumps O(1) instead of freeing hundreds of MB
+        synchronously on the UI thread.
+        """
+        self._generation += 1
+
+    def gc_stale(self) -> None:
+        """Drop all entries older than the current generation."""
+        for cache_key in [k for k, v in self._items.items() if v.generation < self._generation]:
+            item = self._items.pop(cache_key, None)
+            if item is not None:
+                self._total_bytes -= item.nbytes
+        for pyramid_key in [
+            k for k, v in self._pyramid_items.items() if v.generation < self._generation
+        ]:
+            item = self._pyramid_items.pop(pyramid_key, None)
+            if item is not None:
+                self._total_bytes -= item.nbytes
+
     def invalidate_image(self, image_id: int) -> None:
         """Remove all cached entries for a given image id."""
         for cache_key in [k for k in self._items.keys() if k[0] == image_id]:
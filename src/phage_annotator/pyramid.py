@@ -9,6 +9,8 @@ from __future__ import annotations
 
 import numpy as np
 
+from phage_annotator.fast_pool import mean_pool2d
+
 
 def pyramid_level_factor(level: int) -> int:
     """Return the integer downsample factor for a pyramid level."""
@@ -40,8 +42,20 @@ def downsample_mean_pool(frame: np.ndarray, factor: int) -> np.ndarray:
     w_trim = (w // factor) * factor
     if h_trim == 0 or w_trim == 0:
         return frame
+    if frame.ndim == 2:
+        # Parallel single-pass kernel when Numba is available; avoids the
+        # reshape view chain and its float temporary.
+        pooled = mean_pool2d(frame, factor)
+        if pooled is not None:
+            return pooled
     trimmed = frame[:h_trim, :w_trim]
-    pooled = trimmed.reshape(h_trim // factor, factor, w_trim // factor, factor).mean(
-        axis=(1, 3), dtype=np.float32
-    )
+    blocks = trimmed.reshape(h_trim // factor, factor, w_trim // factor, factor)
+    if frame.dtype.kind in "iu":
+        # Integer accumulator keeps native uint16 data uint16 through the
+        # pyramid instead of upcasting to float32 and doubling the
+        # bandwidth of every downstream step.
+        acc_dtype = np.uint64 if frame.dtype.kind == "u" else np.int64
+        pooled = blocks.sum(axis=(1, 3), dtype=acc_dtype) // (factor * factor)
+        return pooled.astype(frame.dtype, copy=False)
+    pooled = blocks.mean(axis=(1, 3), dtype=np.float32)
     return pooled
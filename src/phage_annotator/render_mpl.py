@@ -34,7 +34,7 @@ Conventions
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 import matplotlib
 import matplotlib.pyplot as plt
@@ -46,6 +46,28 @@ from phage_annotator.scalebar import ScaleBarSpec
 from phage_annotator.session_state import ViewState
 
 
+@dataclass(slots=True)
+class PanelBundle:
+    """Per-panel values for the five display panels.
+
+    One attribute per panel replaces the string-keyed dicts that were
+    rebuilt for titles/extents/norms/cmaps/ranges on every refresh;
+    attribute loads avoid the hash-and-probe on both build and lookup.
+    Unset panels stay ``None``.
+    """
+
+    frame: Any = None
+    mean: Any = None
+    composite: Any = None
+    support: Any = None
+    std: Any = None
+
+    def get(self, panel: str, default: Any = None) -> Any:
+        """Dict-style lookup for dynamically named panels."""
+        value = getattr(self, panel, None)
+        return default if value is None else value
+
+
 @dataclass(frozen=True)
 class RenderContext:
     """Render inputs for image panels and overlays.
@@ -58,23 +80,25 @@ class RenderContext:
         Support image frame (2D array) in display resolution.
     projections : dict[str, np.ndarray]
         Precomputed projections keyed by name ("mean", "std", "composite").
+        Values are ``None`` while a projection is still being computed; the
+        corresponding artist is left untouched.
     view : ViewState
         View state (T/Z, crop/ROI, overlay toggle).
     annotations : Sequence[object]
         Filtered annotations for the current view scope.
     panel_visibility : dict[str, bool]
         Panel visibility map keyed by panel id.
-    titles : dict[str, str]
-        Panel titles keyed by panel id.
-    extents : dict[str, tuple[float, float, float, float]]
+    titles : PanelBundle
+        Panel titles (str per panel).
+    extents : PanelBundle
         Axis extents per panel in display coordinates.
     std_range : tuple[float, float]
         vmin/vmax for the std panel.
-    norms : dict[str, matplotlib.colors.Normalize]
+    norms : PanelBundle
         Per-panel normalization objects derived from display mappings.
-    panel_cmaps : dict[str, matplotlib.colors.Colormap]
+    panel_cmaps : PanelBundle
         Per-panel colormaps.
-    panel_ranges : dict[str, tuple[float, float]]
+    panel_ranges : PanelBundle
         Per-panel vmin/vmax ranges used as a fallback.
     panel_annotations : dict[str, list[tuple[float, float, str, bool]]]
         Per-panel display coordinates for annotations:
@@ -85,8 +109,8 @@ class RenderContext:
         Overlay text to display in the active panel.
     marker_size : float
         Marker size for scatter annotations.
-    localization_points : list[tuple[float, float, float]]
-        Optional localization overlays as (x, y, value).
+    localization_points : np.ndarray or None
+        Optional localization overlays as an (N, 3) array of (x, y, value).
     localization_visible : bool
         Whether to render localization overlays.
     threshold_mask : np.ndarray or None
@@ -129,21 +153,21 @@ class RenderContext:
 
     image_frame: np.ndarray
     support_frame: Optional[np.ndarray]
-    projections: Dict[str, np.ndarray]
+    projections: Dict[str, Optional[np.ndarray]]
     view: ViewState
     annotations: Sequence[object]
     panel_visibility: Dict[str, bool]
-    titles: Dict[str, str]
-    extents: Dict[str, Tuple[float, float, float, float]]
+    titles: PanelBundle
+    extents: PanelBundle
     std_range: Tuple[float, float]
     panel_annotations: Dict[str, List[Tuple[float, float, str, bool]]]
     roi_overlays: Dict[str, List[Tuple[str, object, str]]]
     overlay_text: Optional[str]
     marker_size: float
-    norms: Dict[str, matplotlib.colors.Normalize]
-    panel_cmaps: Dict[str, matplotlib.colors.Colormap]
-    panel_ranges: Dict[str, Tuple[float, float]]
-    localization_points: List[Tuple[float, float, float]]
+    norms: PanelBundle
+    panel_cmaps: PanelBundle
+    panel_ranges: PanelBundle
+    localization_points: Optional[np.ndarray]
     localization_visible: bool
     threshold_mask: Optional[np.ndarray]
     threshold_extent: Optional[Tuple[float, float, float, float]]
@@ -239,35 +263,35 @@ class Renderer:
         """Update image artists in-place for all visible panels."""
         titles = ctx.titles
         if "frame" in self.axes:
-            self.axes["frame"].set_title(titles.get("frame", ""))
+            self.axes["frame"].set_title(titles.frame or "")
         if "mean" in self.axes:
-            self.axes["mean"].set_title(titles.get("mean", ""))
+            self.axes["mean"].set_title(titles.mean or "")
         if "composite" in self.axes:
-            self.axes["composite"].set_title(titles.get("composite", ""))
+            self.axes["composite"].set_title(titles.composite or "")
         if "support" in self.axes:
-            self.axes["support"].set_title(titles.get("support", ""))
+            self.axes["support"].set_title(titles.support or "")
         if "std" in self.axes:
-            self.axes["std"].set_title(titles.get("std", ""))
-
-        frame_norm = ctx.norms.get("frame")
-        std_norm = ctx.norms.get("std")
-        mean_norm = ctx.norms.get("mean")
-        comp_norm = ctx.norms.get("composite")
-        support_norm = ctx.norms.get("support")
-        frame_range = ctx.panel_ranges.get("frame", ctx.std_range)
-        mean_range = ctx.panel_ranges.get("mean", ctx.std_range)
-        comp_range = ctx.panel_ranges.get("composite", ctx.std_range)
-        support_range = ctx.panel_ranges.get("support", ctx.std_range)
-        std_range = ctx.panel_ranges.get("std", ctx.std_range)
+            self.axes["std"].set_title(titles.std or "")
+
+        frame_norm = ctx.norms.frame
+        std_norm = ctx.norms.std
+        mean_norm = ctx.norms.mean
+        comp_norm = ctx.norms.composite
+        support_norm = ctx.norms.support
+        frame_range = ctx.panel_ranges.frame or ctx.std_range
+        mean_range = ctx.panel_ranges.mean or ctx.std_range
+        comp_range = ctx.panel_ranges.composite or ctx.std_range
+        support_range = ctx.panel_ranges.support or ctx.std_range
+        std_range = ctx.panel_ranges.std or ctx.std_range
         if "frame" in self.axes:
             self.image_artists["frame"] = _update_or_create(
                 self.axes["frame"],
                 self.image_artists["frame"],
                 ctx.image_frame,
-                ctx.panel_cmaps.get("frame", self.colormaps[0]),
+                ctx.panel_cmaps.frame or self.colormaps[0],
                 frame_range[0],
                 frame_range[1],
-                ctx.extents.get("frame"),
+                ctx.extents.frame,
                 norm=frame_norm,
             )
             overlay = ctx.overlay_frame
@@ -310,10 +334,10 @@ class Renderer:
                 self.axes["mean"],
                 self.image_artists["mean"],
                 ctx.projections.get("mean"),
-                ctx.panel_cmaps.get("mean", self.colormaps[0]),
+                ctx.panel_cmaps.mean or self.colormaps[0],
                 mean_range[0],
                 mean_range[1],
-                ctx.extents.get("mean"),
+                ctx.extents.mean,
                 norm=mean_norm,
             )
         if "composite" in self.axes:
@@ -321,10 +345,10 @@ class Renderer:
                 self.axes["composite"],
                 self.image_artists["composite"],
                 ctx.projections.get("composite"),
-                ctx.panel_cmaps.get("composite", self.colormaps[0]),
+                ctx.panel_cmaps.composite or self.colormaps[0],
                 comp_range[0],
                 comp_range[1],
-                ctx.extents.get("composite"),
+                ctx.extents.composite,
                 norm=comp_norm,
             )
         if "support" in self.axes and ctx.support_frame is not None:
@@ -332,10 +356,10 @@ class Renderer:
                 self.axes["support"],
                 self.image_artists["support"],
                 ctx.support_frame,
-                ctx.panel_cmaps.get("support", self.colormaps[0]),
+                ctx.panel_cmaps.support or self.colormaps[0],
                 support_range[0],
                 support_range[1],
-                ctx.extents.get("support"),
+                ctx.extents.support,
                 norm=support_norm,
             )
         if "std" in self.axes:
@@ -343,10 +367,10 @@ class Renderer:
                 self.axes["std"],
                 self.image_artists["std"],
                 ctx.projections.get("std"),
-                ctx.panel_cmaps.get("std", self.colormaps[0]),
+                ctx.panel_cmaps.std or self.colormaps[0],
                 std_range[0],
                 std_range[1],
-                ctx.extents.get("std"),
+                ctx.extents.std,
                 norm=std_norm,
             )
         self._flush()
@@ -450,13 +474,19 @@ class Renderer:
             if ax is not None:
                 for x, y, text in ctx.particle_labels:
                     ax.text(x, y, text, fontsize=8, color="yellow")
-        if ctx.localization_visible and ctx.localization_points:
+        if ctx.localization_visible and ctx.localization_points is not None:
             ax = self.axes.get("frame")
-            if ax is not None:
-                xs = [p[0] for p in ctx.localization_points]
-                ys = [p[1] for p in ctx.localization_points]
-                vals = [p[2] for p in ctx.localization_points]
-                ax.scatter(xs, ys, c=vals, s=18, cmap="viridis", edgecolors="none", alpha=0.75)
+            pts = np.asarray(ctx.localization_points)
+            if ax is not None and pts.size:
+                ax.scatter(
+                    pts[:, 0],
+                    pts[:, 1],
+                    c=pts[:, 2],
+                    s=18,
+                    cmap="viridis",
+                    edgecolors="none",
+                    alpha=0.75,
+                )
         if ctx.density_contours and ctx.overlay_frame is not None:
             ax = self.axes.get("frame")
             if ax is not None:
@@ -45,6 +45,14 @@ class FrameRingBuffer:
             self._queue.clear()
             self._indices.clear()
 
+    def set_capacity(self, capacity: int) -> None:
+        """Resize in place; queued frames beyond the new capacity are dropped."""
+        with self._lock:
+            self._capacity = int(max(1, capacity))
+            while len(self._queue) > self._capacity:
+                t_idx, _ = self._queue.pop()
+                self._indices.discard(t_idx)
+
     def push_block(self, t_start: int, frames: np.ndarray) -> int:
         """Append a contiguous block of frames if space is available."""
         added = 0
@@ -71,6 +79,31 @@ class FrameRingBuffer:
             self._indices.discard(t_idx)
         return t_idx, frame
 
+    def pop_batch(self, n: int, timeout: float = 0.0) -> list:
+        """Pop up to ``n`` frames under a single lock acquisition.
+
+        Blocks up to ``timeout`` seconds for at least one frame; returns an
+        empty list on timeout. Batching amortizes lock traffic with the
+        prefetcher when the consumer runs faster than one frame per acquire.
+        """
+        deadline = time.monotonic() + max(0.0, timeout)
+        while True:
+            with self._lock:
+                if self._queue:
+                    items = []
+                    for _ in range(min(int(max(1, n)), len(self._queue))):
+                        t_idx, frame = self._queue.popleft()
+                        self._indices.discard(t_idx)
+                        items.append((t_idx, frame))
+                    return items
+            if time.monotonic() >= deadline:
+                return []
+            time.sleep(0.002)
+
+    def is_empty(self) -> bool:
+        with self._lock:
+            return not self._queue
+
     def stats(self) -> BufferStats:
         with self._lock:
             return BufferStats(filled=len(self._queue), capacity=self._capacity)
@@ -108,6 +141,18 @@ class BlockPrefetcher:
         self._block_size = int(max(1, block_size))
         self._max_inflight_blocks = int(max(1, max_inflight_blocks))
 
+    @property
+    def block_size(self) -> int:
+        return self._block_size
+
+    @property
+    def max_inflight_blocks(self) -> int:
+        return self._max_inflight_blocks
+
+    def set_block_size(self, block_size: int) -> None:
+        """Retune the block size at runtime; the next issued read uses it."""
+        self._block_size = int(max(1, block_size))
+
     def start(self, current_t: int, t_max: int, z_idx: int, loop: bool) -> None:
         """Start (or restart) prefetching from the next frame after current_t."""
         self.request_jump(current_t, t_max, z_idx, loop)
@@ -117,6 +162,30 @@ class BlockPrefetcher:
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
 
+    def prime_block(self, current_t: int, t_max: int, z_idx: int, loop: bool = False) -> None:
+        """Synchronously read and enqueue the first block after ``current_t``.
+
+        Running the first read on the caller's thread means frames are
+        already queued when the worker starts, so playback begins without a
+        cold-disk underrun. Call :meth:`resume` afterwards to continue
+        prefetching asynchronously from where the primed block ended.
+        """
+        with self._lock:
+            self._t_max = int(max(0, t_max))
+            self._z_idx = int(max(0, z_idx))
+            self._loop = bool(loop)
+            self._reset_requested = False
+        t_start = int(current_t + 1)
+        t_stop = min(t_start + self._block_size, self._t_max + 1)
+        if t_stop > t_start:
+            block = self._read_block(t_start, t_stop, self._z_idx)
+            self._ring.push_block(t_start, block)
+            t_start = t_stop
+        if self._loop and t_start > self._t_max:
+            t_start = 0
+        with self._lock:
+            self._next_index = t_start
+
     def request_jump(self, current_t: int, t_max: int, z_idx: int, loop: bool) -> None:
         """Reset the prefetch cursor to a new target index."""
         with self._lock:
@@ -132,6 +201,31 @@ class BlockPrefetcher:
             self._thread.join(timeout=0.2)
         self._thread = None
 
+    def pause(self) -> None:
+        """Stop issuing new block reads without flushing queued frames.
+
+        The prefetch cursor survives, so :meth:`resume` continues reading
+        where the pause left off and a quick play toggle reuses the warm ring.
+        """
+        self.stop()
+
+    def finished(self) -> bool:
+        """True once the worker has stopped issuing reads.
+
+        Set when the reader runs past the end of data in non-loop mode (or
+        after :meth:`stop`); the consumer combines this with ring emptiness
+        to tell end-of-stack apart from an ordinary underrun.
+        """
+        return self._stop_event.is_set()
+
+    def resume(self) -> None:
+        """Restart block reads from the preserved cursor (no ring reset)."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
     def _run(self) -> None:
         while not self._stop_event.is_set():
             with self._lock:
@@ -31,6 +31,12 @@ class RoiManager:
     rois_by_image: Dict[int, List[Roi]] = field(default_factory=dict)
     active_roi_id: Optional[int] = None
     roi_templates: Dict[str, Roi] = field(default_factory=dict)  # P5.2: ROI templates
+    # Monotonic change counter; consumers use it to invalidate derived caches.
+    version: int = 0
+
+    def bump_version(self) -> None:
+        """Record an external mutation (direct edits to Roi fields/points)."""
+        self.version += 1
 
     def list_rois(self, image_id: int) -> List[Roi]:
         return list(self.rois_by_image.get(image_id, []))
@@ -38,12 +44,14 @@ class RoiManager:
     def add_roi(self, image_id: int, roi: Roi) -> None:
         self.rois_by_image.setdefault(image_id, []).append(roi)
         self.active_roi_id = roi.roi_id
+        self.version += 1
 
     def delete_roi(self, image_id: int, roi_id: int) -> None:
         rois = self.rois_by_image.get(image_id, [])
         self.rois_by_image[image_id] = [r for r in rois if r.roi_id != roi_id]
         if self.active_roi_id == roi_id:
             self.active_roi_id = None
+        self.version += 1
 
     def get_active(self, image_id: int) -> Optional[Roi]:
         for roi in self.rois_by_image.get(image_id, []):
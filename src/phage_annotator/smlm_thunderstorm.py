@@ -72,7 +72,12 @@ def detect_candidates(
     finite = masked[np.isfinite(masked)]
     if finite.size == 0:
         return np.empty((0, 2), dtype=int)
-    threshold = np.median(finite) + params.detection_thr_sigma * mad_sigma(finite)
+    # Selection-based median (see mad_sigma): exact even-length averaging
+    # is irrelevant for a detection threshold.
+    k = finite.size // 2
+    threshold = np.partition(finite, k)[k] + params.detection_thr_sigma * mad_sigma(
+        finite
+    )
     coords = local_maxima(masked, threshold, footprint=3)
     if coords.size == 0:
         return coords
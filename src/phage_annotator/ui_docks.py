@@ -123,6 +123,7 @@ def init_panels(self, dock_menu: QtWidgets.QMenu) -> None:
     self.preset_default_act.triggered.connect(lambda: self.apply_preset("Default"))
     apply_panel_defaults(self)
     self._restore_sidebar_mode()
+    self._update_diag_live()
 
 
 def build_panel_registry(self) -> List[PanelSpec]:
@@ -304,6 +305,7 @@ def wire_dock_action(
             checkbox.blockSignals(True)
             checkbox.setChecked(visible)
             checkbox.blockSignals(False)
+            self._update_diag_live()
             self._refresh_image()
 
     action.toggled.connect(_set_visible)
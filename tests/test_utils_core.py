@@ -125,3 +125,24 @@ def test_projection_cache_eviction() -> None:
     # Should evict the oldest if over budget after adding another item
     cache.put((4, "mean", (0.0, 0.0, 0.0, 0.0), -1, -1), d)
     assert cache.get((1, "mean", (0.0, 0.0, 0.0, 0.0), -1, -1)) is None
+
+
+def test_normalize_to_u8_matches_reference() -> None:
+    from phage_annotator.fast_norm import normalize_to_u8
+
+    rng = np.random.default_rng(0)
+    frame = rng.uniform(-50, 500, size=(16, 24)).astype(np.float32)
+    vmin, vmax = 10.0, 300.0
+    scale = 255.0 / (vmax - vmin)
+    expected = np.clip((frame - vmin) * scale, 0, 255).astype(np.uint8)
+    out = normalize_to_u8(frame, vmin, scale)
+    assert out.dtype == np.uint8
+    assert np.abs(out.astype(int) - expected.astype(int)).max() <= 1
+
+    # Buffer reuse: same-shape calls write into the provided output.
+    out2 = normalize_to_u8(frame, vmin, scale, out=out)
+    assert out2 is out
+
+    block = np.stack([frame, frame])
+    out3 = normalize_to_u8(block, vmin, scale)
+    assert out3.shape == block.shape